@@ -1,3 +1,4 @@
+import asyncio
 from datetime import datetime
 from typing import List, Optional, cast
 
@@ -11,10 +12,10 @@ from fastapi import (
     status,
 )
 from slugify import slugify
-from sqlalchemy import case, func
+from sqlalchemy import and_, case, func, insert, true
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy.orm import selectinload, joinedload
+from sqlalchemy.orm import joinedload, load_only, selectinload
 from starlette.responses import JSONResponse
 
 from core.api_response import api_response
@@ -23,17 +24,16 @@ from db.models.superadmin import Category, SubCategory, Industries
 from db.sessions.database import get_db
 from schemas.categories import CategoryOut, MenuCategoryOut, MenuSubCategoryOut
 from services.category_service import (
-    check_category_description_exists,
-    check_category_meta_description_exists,
-    check_category_meta_title_exists,
-    check_category_name_exists,
-    check_category_slug_exists,
-    validate_category_conflicts,
+    category_cache,
+    find_category_conflict,
     validate_category_data,
-    validate_subcategory_conflicts,
 )
 from utils.exception_handlers import exception_handler
-from utils.file_uploads import get_media_url, save_uploaded_file
+from utils.file_uploads import (
+    get_media_url,
+    remove_file_if_exists,
+    save_uploaded_file,
+)
 from utils.id_generators import (
     generate_digits_lowercase,
     generate_digits_uppercase,
@@ -72,14 +72,6 @@ async def create_category_or_subcategory(
         )
     )
 
-    await check_category_name_exists(db, name)
-    await check_category_slug_exists(db, slug)
-    await check_category_description_exists(db, description)
-    await check_category_meta_title_exists(db, meta_title)
-    await check_category_meta_description_exists(db, meta_description)
-
-
-
     final_slug = slugify(slug)
 
     # Validate industry_id if provided for category creation
@@ -99,10 +91,7 @@ async def create_category_or_subcategory(
 
     if is_subcategory:
         # Subcategory: validate parent category
-        result = await db.execute(
-            select(Category).where(Category.category_id == category_id)
-        )
-        parent_category = result.scalars().first()
+        parent_category = await db.get(Category, category_id)
         if not parent_category:
             return api_response(
                 status.HTTP_404_NOT_FOUND, "Parent category not found"
@@ -131,77 +120,96 @@ async def create_category_or_subcategory(
                     "Industry ID does not match parent category's industry"
                 )
 
-        # Check for subcategory conflicts
-        conflict_error = await validate_subcategory_conflicts(
-            db, name, final_slug, description, meta_title, meta_description
+    if is_subcategory:
+        upload_path = f"subcategories/{category_id}/{final_slug}"
+    else:
+        upload_path = f"categories/{final_slug}"
+
+    # The uniqueness check (every rule against categories and subcategories
+    # in one query) and the thumbnail upload don't depend on each other, so
+    # they run concurrently. Both are awaited to completion so the session is
+    # never left mid-query, and a stored thumbnail for a rejected request is
+    # removed again.
+    conflict_error, uploaded_url = await asyncio.gather(
+        find_category_conflict(
+            db,
+            name,
+            final_slug,
+            description,
+            meta_title,
+            meta_description,
+            is_subcategory,
+        ),
+        save_uploaded_file(file, upload_path),
+        return_exceptions=True,
+    )
+    if isinstance(uploaded_url, BaseException):
+        raise uploaded_url
+    if isinstance(conflict_error, BaseException):
+        await remove_file_if_exists(uploaded_url)
+        raise conflict_error
+    if conflict_error:
+        await remove_file_if_exists(uploaded_url)
+        return api_response(
+            status.HTTP_400_BAD_REQUEST, conflict_error, log_error=True
+        )
+
+    # One INSERT ... RETURNING per branch; nothing is loaded back afterwards
+    if is_subcategory:
+        stmt = (
+            insert(SubCategory)
+            .values(
+                id=generate_lower_uppercase(6),
+                subcategory_id=generate_digits_lowercase(6),
+                category_id=category_id,
+                subcategory_name=name,
+                subcategory_slug=final_slug,
+                subcategory_description=description,
+                subcategory_meta_title=meta_title,
+                subcategory_meta_description=meta_description,
+                subcategory_img_thumbnail=uploaded_url,
+                featured_subcategory=featured,
+                show_in_menu=show_in_menu,
+            )
+            .returning(SubCategory.subcategory_id)
         )
-        if conflict_error:
-            return api_response(
-                status.HTTP_400_BAD_REQUEST, conflict_error, log_error=True
+    else:
+        stmt = (
+            insert(Category)
+            .values(
+                category_id=generate_digits_uppercase(6),
+                industry_id=industry_id,
+                category_name=name,
+                category_slug=final_slug,
+                category_description=description,
+                category_meta_title=meta_title,
+                category_meta_description=meta_description,
+                category_img_thumbnail=uploaded_url,
+                featured_category=featured,
+                show_in_menu=show_in_menu,
             )
-
-        # Create SubCategory
-        new_subcategory = SubCategory(
-            id=generate_lower_uppercase(6),
-            subcategory_id=generate_digits_lowercase(6),
-            category_id=category_id,
-            subcategory_name=name,
-            subcategory_slug=final_slug,
-            subcategory_description=description,
-            subcategory_meta_title=meta_title,
-            subcategory_meta_description=meta_description,
-            featured_subcategory=featured,
-            show_in_menu=show_in_menu,
+            .returning(Category.category_id)
         )
 
-        sub_path = f"subcategories/{category_id}/{final_slug}"
-        uploaded_url = await save_uploaded_file(file, sub_path)
-        new_subcategory.subcategory_img_thumbnail = uploaded_url
-
-        db.add(new_subcategory)
+    try:
+        new_id = (await db.execute(stmt)).scalar_one()
         await db.commit()
-        await db.refresh(new_subcategory)
+    except Exception:
+        await remove_file_if_exists(uploaded_url)
+        raise
+    category_cache.clear()
 
+    if is_subcategory:
         return api_response(
             status.HTTP_201_CREATED,
             "Subcategory created successfully",
-            data={"subcategory_id": new_subcategory.subcategory_id},
-        )
-
-    # Category creation
-    conflict_error = await validate_category_conflicts(
-        db, name, final_slug, description, meta_title, meta_description
-    )
-    if conflict_error:
-        return api_response(
-            status.HTTP_400_BAD_REQUEST, conflict_error, log_error=True
+            data={"subcategory_id": new_id},
         )
 
-    # Create Category
-    new_category = Category(
-        category_id=generate_digits_uppercase(6),
-        industry_id=industry_id,
-        category_name=name,
-        category_slug=final_slug,
-        category_description=description,
-        category_meta_title=meta_title,
-        category_meta_description=meta_description,
-        featured_category=featured,
-        show_in_menu=show_in_menu,
-    )
-
-    cat_path = f"categories/{final_slug}"
-    uploaded_url = await save_uploaded_file(file, cat_path)
-    new_category.category_img_thumbnail = uploaded_url
-
-    db.add(new_category)
-    await db.commit()
-    await db.refresh(new_category)
-
     return api_response(
         status_code=status.HTTP_201_CREATED,
         message="Category created successfully",
-        data={"category_id": new_category.category_id},
+        data={"category_id": new_id},
     )
 
 
@@ -214,53 +222,79 @@ async def get_all_categories(
     ),
     db: AsyncSession = Depends(get_db),
 ) -> JSONResponse:
-    # Load categories with subcategories
-    stmt = select(Category).options(selectinload(Category.subcategories))
+    cache_key = ("list", status_filter)
+    data = category_cache.get(cache_key)
+    if data is not None:
+        return api_response(
+            status_code=status.HTTP_200_OK,
+            message="Categories fetched successfully",
+            data=data,
+        )
+
+    # Plain columns with the subcategory count grouped in SQL, so neither
+    # categories nor subcategories are hydrated as ORM objects
+    subcategory_join = SubCategory.category_id == Category.category_id
+    if status_filter is not None:
+        subcategory_join = and_(
+            subcategory_join, SubCategory.subcategory_status == status_filter
+        )
+
+    stmt = (
+        select(
+            Category.category_id,
+            Category.industry_id,
+            # Title-cased by the database rather than per row in Python
+            func.initcap(Category.category_name).label("category_name"),
+            Category.category_description,
+            Category.category_slug,
+            Category.category_meta_title,
+            Category.category_meta_description,
+            Category.category_img_thumbnail,
+            Category.featured_category,
+            Category.show_in_menu,
+            Category.category_status,
+            Category.category_tstamp,
+            func.count(SubCategory.subcategory_id).label("subcategory_count"),
+        )
+        .outerjoin(SubCategory, subcategory_join)
+        .group_by(Category.category_id)
+    )
 
     if status_filter is not None:
         stmt = stmt.where(Category.category_status == status_filter)
 
     result = await db.execute(stmt)
-    categories = result.scalars().unique().all()
 
     data = []
 
-    for cat in categories:
-        # Filter subcategories by status_filter
-        if status_filter is not None:
-            subcats = [
-                s
-                for s in cat.subcategories
-                if s.subcategory_status == status_filter
-            ]
-        else:
-            subcats = cat.subcategories
-
+    for row in result.mappings():
+        subcategory_count = row["subcategory_count"]
         data.append(
             {
-                "category_id": cat.category_id,
-                "industry_id": cat.industry_id,
-                "category_name": cat.category_name.title(),
-                "category_description": cat.category_description,
-                "category_slug": cat.category_slug,
-                "category_meta_title": cat.category_meta_title,
-                "category_meta_description": cat.category_meta_description,
+                "category_id": row["category_id"],
+                "industry_id": row["industry_id"],
+                "category_name": row["category_name"],
+                "category_description": row["category_description"],
+                "category_slug": row["category_slug"],
+                "category_meta_title": row["category_meta_title"],
+                "category_meta_description": row["category_meta_description"],
                 "category_img_thumbnail": get_media_url(
-                    cat.category_img_thumbnail
+                    row["category_img_thumbnail"]
                 ),
-                "featured_category": cat.featured_category,
-                "show_in_menu": cat.show_in_menu,
-                "category_status": cat.category_status,
+                "featured_category": row["featured_category"],
+                "show_in_menu": row["show_in_menu"],
+                "category_status": row["category_status"],
                 "category_tstamp": (
-                    cast(datetime, cat.category_tstamp).isoformat()
-                    if cat.category_tstamp
+                    cast(datetime, row["category_tstamp"]).isoformat()
+                    if row["category_tstamp"]
                     else None
                 ),
-                "has_subcategories": len(subcats) > 0,
-                "subcategory_count": len(subcats),
+                "has_subcategories": subcategory_count > 0,
+                "subcategory_count": subcategory_count,
             }
         )
 
+    category_cache.set(cache_key, data)
     return api_response(
         status_code=status.HTTP_200_OK,
         message="Categories fetched successfully",
@@ -273,6 +307,14 @@ async def get_all_categories(
 async def category_analytics(
     db: AsyncSession = Depends(get_db),
 ) -> JSONResponse:
+    data = category_cache.get(("analytics",))
+    if data is not None:
+        return api_response(
+            status.HTTP_200_OK,
+            "Category analytics fetched successfully",
+            data=data,
+        )
+
     # Optimized Aggregation Query
     stats_query = await db.execute(
         select(
@@ -292,27 +334,24 @@ async def category_analytics(
     )
     stats = stats_query.first()
 
-    # Subcategory Stats in One ORM Query
+    # Subcategory counts per category, counted by the database so no
+    # subcategory rows are loaded
     result = await db.execute(
-        select(Category).options(selectinload(Category.subcategories))
+        select(
+            Category.category_name,
+            func.count(SubCategory.subcategory_id).label("subcategory_count"),
+        )
+        .outerjoin(SubCategory, SubCategory.category_id == Category.category_id)
+        .group_by(Category.category_id, Category.category_name)
     )
-    categories = result.scalars().all()
-
-    total_subcategories = 0
-    categories_with_subs = 0
-    subcategory_distribution = []
+    subcategory_distribution = [row._asdict() for row in result.all()]
 
-    for category in categories:
-        sub_count = len(category.subcategories)
-        total_subcategories += sub_count
-        if sub_count > 0:
-            categories_with_subs += 1
-        subcategory_distribution.append(
-            {
-                "category_name": category.category_name,
-                "subcategory_count": sub_count,
-            }
-        )
+    total_subcategories = sum(
+        row["subcategory_count"] for row in subcategory_distribution
+    )
+    categories_with_subs = sum(
+        1 for row in subcategory_distribution if row["subcategory_count"] > 0
+    )
 
     total_categories = getattr(stats, "total", 0) if stats else 0
     avg_subcategories_per_category = (
@@ -325,27 +364,30 @@ async def category_analytics(
         reverse=True,
     )[:5]
 
+    data = {
+        "totals": {
+            "total_categories": getattr(stats, "total", 0),
+            "active_categories": getattr(stats, "active", 0),
+            "inactive_categories": getattr(stats, "inactive", 0),
+            "featured_categories": getattr(stats, "featured", 0),
+            "show_in_menu": getattr(stats, "show_in_menu", 0),
+            "hidden_from_menu": getattr(stats, "hidden_from_menu", 0),
+        },
+        "subcategory_stats": {
+            "total_subcategories": total_subcategories,
+            "categories_with_subcategories": (categories_with_subs),
+            "avg_subcategories_per_category": round(
+                avg_subcategories_per_category, 2
+            ),
+            "top_categories_by_subcategory_count": top_categories_by_subs,
+        },
+    }
+    category_cache.set(("analytics",), data)
+
     return api_response(
         status.HTTP_200_OK,
         "Category analytics fetched successfully",
-        data={
-            "totals": {
-                "total_categories": getattr(stats, "total", 0),
-                "active_categories": getattr(stats, "active", 0),
-                "inactive_categories": getattr(stats, "inactive", 0),
-                "featured_categories": getattr(stats, "featured", 0),
-                "show_in_menu": getattr(stats, "show_in_menu", 0),
-                "hidden_from_menu": getattr(stats, "hidden_from_menu", 0),
-            },
-            "subcategory_stats": {
-                "total_subcategories": total_subcategories,
-                "categories_with_subcategories": (categories_with_subs),
-                "avg_subcategories_per_category": round(
-                    avg_subcategories_per_category, 2
-                ),
-                "top_categories_by_subcategory_count": top_categories_by_subs,
-            },
-        },
+        data=data,
     )
 
 
@@ -362,7 +404,11 @@ async def get_categories_and_subcategories_by_status(
     db: AsyncSession = Depends(get_db),
 ) -> JSONResponse:
     stmt = (
-        select(Category, Industries.industry_name)
+        select(
+            Category,
+            Industries.industry_name,
+            func.initcap(Category.category_name).label("category_name"),
+        )
         .join(Industries, Category.industry_id == Industries.industry_id)
         .options(selectinload(Category.subcategories))
     )
@@ -375,9 +421,8 @@ async def get_categories_and_subcategories_by_status(
     category_data = result.all()
 
     categories = []
-    for category, industry_name in category_data:
-        # Process category name and image
-        category.category_name = category.category_name.title()
+    for category, industry_name, category_name in category_data:
+        # Process category image
         category.category_img_thumbnail = get_media_url(category.category_img_thumbnail)
 
         if category.category_status:
@@ -395,7 +440,7 @@ async def get_categories_and_subcategories_by_status(
             "category_id": category.category_id,
             "industry_id": category.industry_id,
             "industry_name": industry_name,
-            "category_name": category.category_name,
+            "category_name": category_name,
             "category_description": category.category_description,
             "category_slug": category.category_slug,
             "category_meta_title": category.category_meta_title,
@@ -422,77 +467,84 @@ async def get_categories_and_subcategories_by_status(
 async def total_categories_count(
     db: AsyncSession = Depends(get_db),
 ) -> JSONResponse:
-    # Category aggregation
-    category_query = await db.execute(
-        select(
-            func.count().label("total"),
-            func.count(case((Category.category_status.is_(False), 1))).label(
-                "active"
-            ),
-            func.count(case((Category.category_status.is_(True), 1))).label(
-                "inactive"
-            ),
+    data = category_cache.get(("totals",))
+    if data is not None:
+        return api_response(
+            status.HTTP_200_OK,
+            "Category total count fetched successfully",
+            data=data,
         )
+
+    # Category and subcategory aggregation. Each side is a one-row
+    # aggregate, so cross joining them returns both in one round trip.
+    category_stats = select(
+        func.count().label("total"),
+        func.count(case((Category.category_status.is_(False), 1))).label(
+            "active"
+        ),
+        func.count(case((Category.category_status.is_(True), 1))).label(
+            "inactive"
+        ),
+    ).subquery("category_stats")
+    subcategory_stats = select(
+        func.count().label("total"),
+        func.count(
+            case((SubCategory.subcategory_status.is_(False), 1))
+        ).label("active"),
+        func.count(
+            case((SubCategory.subcategory_status.is_(True), 1))
+        ).label("inactive"),
+    ).subquery("subcategory_stats")
+
+    stats_query = await db.execute(
+        select(
+            category_stats.c.total.label("total_categories"),
+            category_stats.c.active.label("active_categories"),
+            category_stats.c.inactive.label("inactive_categories"),
+            subcategory_stats.c.total.label("total_subcategories"),
+            subcategory_stats.c.active.label("active_subcategories"),
+            subcategory_stats.c.inactive.label("inactive_subcategories"),
+        ).select_from(category_stats.join(subcategory_stats, true()))
     )
-    category_stats = category_query.first()
+    stats = stats_query.one()
 
-    # Subcategory aggregation
-    subcategory_query = await db.execute(
+    # Per-category subcategory counts, grouped in SQL so no subcategory rows
+    # are loaded. subcategory_status False means active.
+    result = await db.execute(
         select(
-            func.count().label("total"),
+            Category.category_name,
+            func.count(SubCategory.subcategory_id).label("total_subcategories"),
             func.count(
                 case((SubCategory.subcategory_status.is_(False), 1))
-            ).label("active"),
+            ).label("active_subcategories"),
             func.count(
                 case((SubCategory.subcategory_status.is_(True), 1))
-            ).label("inactive"),
+            ).label("inactive_subcategories"),
         )
+        .outerjoin(SubCategory, SubCategory.category_id == Category.category_id)
+        .group_by(Category.category_id, Category.category_name)
     )
-    subcategory_stats = subcategory_query.first()
-
-    # Load category names with subcategory stats
-    result = await db.execute(
-        select(Category).options(selectinload(Category.subcategories))
-    )
-    categories = result.scalars().all()
-
-    category_distribution = []
-    for cat in categories:
-        total = len(cat.subcategories)
-        active = sum(
-            1 for s in cat.subcategories if s.subcategory_status is False
-        )
-        inactive = sum(
-            1 for s in cat.subcategories if s.subcategory_status is True
-        )
+    category_distribution = [row._asdict() for row in result.all()]
 
-        category_distribution.append(
-            {
-                "category_name": cat.category_name,
-                "total_subcategories": total,
-                "active_subcategories": active,
-                "inactive_subcategories": inactive,
-            }
-        )
+    data = {
+        "totals": {
+            "total_categories": stats.total_categories,
+            "active_categories": stats.active_categories,
+            "inactive_categories": stats.inactive_categories,
+        },
+        "subcategory_stats": {
+            "total_subcategories": stats.total_subcategories,
+            "active_subcategories": stats.active_subcategories,
+            "inactive_subcategories": stats.inactive_subcategories,
+            "category_distribution": category_distribution,
+        },
+    }
+    category_cache.set(("totals",), data)
 
     return api_response(
         status.HTTP_200_OK,
         "Category total count fetched successfully",
-        data={
-            "totals": {
-                "total_categories": getattr(category_stats, "total", 0),
-                "active_categories": getattr(category_stats, "active", 0),
-                "inactive_categories": getattr(category_stats, "inactive", 0),
-            },
-            "subcategory_stats": {
-                "total_subcategories": getattr(subcategory_stats, "total", 0),
-                "active_subcategories": getattr(subcategory_stats, "active", 0),
-                "inactive_subcategories": getattr(
-                    subcategory_stats, "inactive", 0
-                ),
-                "category_distribution": category_distribution,
-            },
-        },
+        data=data,
     )
 
 
@@ -509,9 +561,23 @@ async def get_menu_categories(
     # Fetch all categories with their subcategories
     # Note: category_status False = active, True = inactive (based on analytics endpoint)
     # Also filter by show_in_menu for menu display
+    # Only the columns the menu shows are loaded, for both sides
     stmt = (
         select(Category)
-        .options(selectinload(Category.subcategories))
+        .options(
+            load_only(
+                Category.category_id,
+                Category.category_name,
+                Category.category_slug,
+            ),
+            selectinload(Category.subcategories).load_only(
+                SubCategory.subcategory_id,
+                SubCategory.subcategory_name,
+                SubCategory.subcategory_slug,
+                SubCategory.subcategory_status,
+                SubCategory.show_in_menu,
+            ),
+        )
         .where(
             Category.category_status == False,  # Active categories
             Category.show_in_menu == True       # Show in menu
@@ -19,11 +19,13 @@ from core.config import settings
 from db.models.superadmin import Category, Industries
 from db.sessions.database import get_db
 from services.category_service import (
+    category_cache,
     validate_category_conflicts,
     validate_category_data,
     activate_category_with_subcategories,
     deactivate_category_with_subcategories,
 )
+from services.product_service import product_cache
 from utils.exception_handlers import exception_handler
 from utils.file_uploads import get_media_url, save_uploaded_file
 
@@ -245,6 +247,8 @@ async def update_category(
         category.category_img_thumbnail = uploaded_url
 
     await db.commit()
+    category_cache.clear()
+    product_cache.clear()
     await db.refresh(category)
     return api_response(
         status.HTTP_200_OK,
@@ -281,6 +285,8 @@ async def soft_delete_category(
     await deactivate_category_with_subcategories(db, category)
 
     await db.commit()
+    category_cache.clear()
+    product_cache.clear()
 
     return api_response(
         status.HTTP_200_OK,
@@ -313,6 +319,8 @@ async def restore_category(
     await activate_category_with_subcategories(db, category)
 
     await db.commit()
+    category_cache.clear()
+    product_cache.clear()
 
     return api_response(
         status.HTTP_200_OK,
@@ -340,6 +348,8 @@ async def hard_delete_category(
     # cascade="all, delete-orphan"
     await db.delete(category)
     await db.commit()
+    category_cache.clear()
+    product_cache.clear()
 
     return api_response(
         status.HTTP_200_OK,
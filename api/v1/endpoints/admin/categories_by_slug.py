@@ -20,6 +20,7 @@ from core.config import settings
 from db.models.superadmin import Category, Industries
 from db.sessions.database import get_db
 from services.category_service import (
+    category_cache,
     validate_category_conflicts,
     validate_category_data,
     activate_category_with_subcategories,
@@ -27,6 +28,7 @@ from services.category_service import (
     activate_subcategory,
     deactivate_subcategory,
 )
+from services.product_service import product_cache
 from utils.exception_handlers import exception_handler
 from utils.file_uploads import get_media_url, save_uploaded_file
 from utils.format_validators import is_valid_filename
@@ -553,6 +555,8 @@ async def update_category_by_slug(
             )
 
     await db.commit()
+    category_cache.clear()
+    product_cache.clear()
     await db.refresh(category)
 
     return api_response(
@@ -584,6 +588,8 @@ async def soft_delete_category_by_slug(
     await deactivate_category_with_subcategories(db, category)
 
     await db.commit()
+    category_cache.clear()
+    product_cache.clear()
     return api_response(
         status.HTTP_200_OK,
         "Category and subcategories soft deleted successfully",
@@ -609,6 +615,8 @@ async def restore_category_by_slug(
     await activate_category_with_subcategories(db, category)
 
     await db.commit()
+    category_cache.clear()
+    product_cache.clear()
     return api_response(
         status.HTTP_200_OK,
         "Category and subcategories restored successfully",
@@ -632,6 +640,8 @@ async def hard_delete_category_by_slug(
 
     await db.delete(category)
     await db.commit()
+    category_cache.clear()
+    product_cache.clear()
 
     return api_response(
         status.HTTP_200_OK,
@@ -23,7 +23,9 @@ from services.category_service import (
     deactivate_category_with_subcategories,
     activate_subcategory,
     deactivate_subcategory,
+    category_cache,
 )
+from services.product_service import product_cache
 from utils.exception_handlers import exception_handler
 from utils.file_uploads import get_media_url, save_uploaded_file
 from utils.format_validators import is_valid_filename
@@ -353,6 +355,8 @@ async def update_category_or_subcategory(
         )
 
     await db.commit()
+    category_cache.clear()
+    product_cache.clear()
     await db.refresh(item)
 
     return api_response(
@@ -385,6 +389,8 @@ async def soft_delete_category_or_subcategory(
         await deactivate_category_with_subcategories(db, category)
 
         await db.commit()
+        category_cache.clear()
+        product_cache.clear()
         return api_response(
             status.HTTP_200_OK,
             "Category and subcategories soft deleted successfully",
@@ -405,6 +411,8 @@ async def soft_delete_category_or_subcategory(
         # Deactivate the subcategory
         await deactivate_subcategory(db, subcategory)
         await db.commit()
+        category_cache.clear()
+        product_cache.clear()
         return api_response(
             status.HTTP_200_OK,
             "Subcategory soft deleted successfully",
@@ -440,6 +448,8 @@ async def restore_category_or_subcategory(
         await activate_category_with_subcategories(db, category)
 
         await db.commit()
+        category_cache.clear()
+        product_cache.clear()
         return api_response(
             status.HTTP_200_OK,
             "Category and subcategories restored successfully",
@@ -460,6 +470,8 @@ async def restore_category_or_subcategory(
         # Activate the subcategory (with parent category validation)
         await activate_subcategory(db, subcategory)
         await db.commit()
+        category_cache.clear()
+        product_cache.clear()
         return api_response(
             status.HTTP_200_OK,
             "Subcategory restored successfully",
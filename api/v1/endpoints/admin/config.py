@@ -15,6 +15,7 @@ from core.config import settings
 from db.models.superadmin import Config
 from db.sessions.database import get_db
 from schemas.config import ConfigOut
+from services.admin_user import config_cache
 from utils.auth import hash_password
 from utils.exception_handlers import exception_handler, handle_not_found
 from utils.file_uploads import (
@@ -94,6 +95,7 @@ async def create_config(
 
     db.add(config)
     await db.commit()
+    config_cache.clear()
     await db.refresh(config)
 
     config.logo_url = get_media_url(config.logo_url)
@@ -180,6 +182,8 @@ async def update_config(
         )
 
     await db.commit()
+
+    config_cache.clear()
     await db.refresh(config)
 
     # Convert internal path to public media URL
@@ -236,6 +240,7 @@ async def update_logo(
     # Update and save
     config.logo_url = uploaded_logo_url
     await db.commit()
+    config_cache.clear()
     await db.refresh(config)
 
     config.logo_url = get_media_url(config.logo_url)
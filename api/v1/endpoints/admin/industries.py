@@ -13,6 +13,7 @@ from core.status_codes import APIResponse, StatusCode
 from db.models.superadmin import Category, Industries, SubCategory, VendorLogin  
 from db.sessions.database import get_db
 from schemas.industry import CreateIndustry, IndustryDetails, IndustryUpdate
+from services.category_service import category_cache
 from utils.exception_handlers import exception_handler
 from utils.id_generators import generate_digits_lowercase
 from utils.validators import is_single_reserved_word
@@ -63,6 +64,7 @@ async def create_industry(
             existing.industry_slug = industry.industry_slug  # Already processed by schema
             existing.timestamp = datetime.now()
             await db.commit()
+            category_cache.clear()
             await db.refresh(existing)
             return api_response(
                 status_code=status.HTTP_200_OK,
@@ -99,6 +101,7 @@ async def create_industry(
     )
     db.add(new_industry)
     await db.commit()
+    category_cache.clear()
     await db.refresh(new_industry)
 
     return api_response(
@@ -223,6 +226,7 @@ async def update_industry(
         industry.industry_slug = update_data.industry_slug
 
     await db.commit()
+    category_cache.clear()
     await db.refresh(industry)
 
     return api_response(
@@ -250,6 +254,7 @@ async def update_industry_status(
 
     industry.is_active = is_active
     await db.commit()
+    category_cache.clear()
     await db.refresh(industry)
 
     return api_response(
@@ -286,6 +291,7 @@ async def delete_industry(
         # Proceed with hard delete
         await db.delete(industry)
         await db.commit()
+        category_cache.clear()
         return api_response(
             status_code=status.HTTP_200_OK,
             message="Industry permanently deleted (hard delete).",
@@ -294,6 +300,7 @@ async def delete_industry(
     if hard_delete:
         await db.delete(industry)
         await db.commit()
+        category_cache.clear()
         return api_response(
             status_code=status.HTTP_200_OK,
             message="Industry permanently deleted (hard delete).",
@@ -301,6 +308,7 @@ async def delete_industry(
     else:
         industry.is_active = True  # Soft delete
         await db.commit()
+        category_cache.clear()
         return api_response(
             status_code=status.HTTP_200_OK,
             message="Industry soft-deleted successfully.",
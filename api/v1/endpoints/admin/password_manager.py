@@ -50,9 +50,7 @@ async def update_password(
     """Update password for an admin user (requires current password)"""
     
     # Step 1: Fetch user by user_id
-    stmt = select(AdminUser).where(AdminUser.user_id == user_id)
-    result = await db.execute(stmt)
-    user = result.scalar_one_or_none()
+    user = await db.get(AdminUser, user_id)
 
     if not user:
         return api_response(
@@ -1,50 +1,172 @@
+import asyncio
+from collections import defaultdict
 import csv
 from datetime import datetime
 import io
-import json
 import os
-from typing import Dict, List, Optional
+from typing import AsyncGenerator, Dict, List, Optional, Set, Tuple
 import aiofiles
+import orjson
 from psycopg2 import IntegrityError
 from slugify import slugify
 
-from utils.file_uploads import get_media_url, save_uploaded_file
-from utils.upload_files import upload_file_to_s3
-from sqlalchemy.orm import selectinload
+from utils.file_uploads import get_media_url, get_media_urls, remove_file_if_exists, save_uploaded_file
+from utils.upload_files import upload_fileobj_to_s3
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import load_only, raiseload
+from sqlalchemy.sql.expression import ClauseElement, Executable
 from utils.id_generators import generate_lowercase
 from schemas.products import ProductByCategoryListResponse, ProductByCategoryResponse, ProductResponse, ProductListResponse, ProductSearchListResponse, ProductSearchResponse, VendorProductsResponse
 from fastapi import APIRouter, Depends, File, Form, Query, UploadFile, HTTPException
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
 from sqlalchemy.ext.asyncio import AsyncSession
+from core.api_response import constructed_response
 from core.status_codes import APIResponse, StatusCode
 from db.models.superadmin import Category, SubCategory, Product, VendorLogin, BusinessProfile
-from db.sessions.database import get_db
+from db.sessions.database import AsyncSessionLocal, get_db
+from services.product_service import product_cache, product_count_cache
+from core.logging_config import get_logger
 from sqlalchemy.future import select
-from sqlalchemy import func
+from sqlalchemy import String, any_, bindparam, exists, false, func, lambda_stmt, literal, or_, text, true, update
 
 UPLOAD_CATEGORY_FOLDER = "uploads/products"
 
+# Max number of concurrent image uploads per request
+IMAGE_UPLOAD_CONCURRENCY = 8
+
+# Rows fetched per round trip when streaming product listings
+PRODUCT_STREAM_BATCH_SIZE = 200
+
+# Base slug for product names slugify reduces to nothing (e.g. non-Latin
+# names), so those products still get a readable, suffixable slug
+FALLBACK_PRODUCT_SLUG = "product"
+
+logger = get_logger(__name__)
+
+# Columns read by _search_item; search queries load nothing else
+SEARCH_ITEM_COLUMNS = (
+    Product.product_id,
+    Product.slug,
+    Product.identification,
+    Product.pricing,
+    Product.images,
+    Product.category_name,
+)
+
+# Plain-row listings select from the table itself, so SQLAlchemy skips ORM
+# entity handling for them
+_products = Product.__table__
+
+# ProductByCategoryResponse fields extracted in SQL, so the JSONB sections
+# are never shipped to or decoded in Python
+CATEGORY_LISTING_COLUMNS = (
+    _products.c.product_id,
+    _products.c.slug,
+    _products.c.timestamp,
+    _products.c.subcategory_name,
+    _products.c.store_name,
+    func.coalesce(_products.c.identification["product_name"].astext, "").label("product_name"),
+    _products.c.identification["product_sku"].astext.label("product_sku"),
+    _products.c.descriptions["short_description"].astext.label("short_description"),
+    _products.c.pricing["selling_price"].astext.label("selling_price"),
+    _products.c.pricing["actual_price"].astext.label("actual_price"),
+    _products.c.inventory["quantity"].astext.label("stock"),
+    _products.c.inventory["stock_alert_status"].astext.label("stock_alert_status"),
+    func.coalesce(_products.c.status_flags["featured_product"].as_boolean(), false()).label("featured_product"),
+    func.coalesce(_products.c.status_flags["published_product"].as_boolean(), true()).label("published_product"),
+    func.coalesce(_products.c.status_flags["product_status"].as_boolean(), false()).label("product_status"),
+    _products.c.images["urls"][0].astext.label("thumbnail_path"),
+)
+
+# Page size bounds for keyset-paginated product listings
+PRODUCT_PAGE_SIZE = 50
+PRODUCT_PAGE_SIZE_MAX = 200
+
+# Upper bound for the matching-row count returned by name search. Category
+# listings count exactly up to this many rows and report the planner's
+# estimate above it, so their total_count is approximate past the cap.
+SEARCH_COUNT_CAP = 1000
+
+# Columns a bulk-upload CSV header must contain
+REQUIRED_CSV_COLUMNS = frozenset({"product_name", "category_name"})
+
+# Stand-in for missing JSON sections, so lookups need no None branch.
+# Never mutate it.
+_EMPTY: dict = {}
+
+# Truthy spellings accepted for boolean CSV columns
+_TRUE_VALUES = frozenset({"true", "1", "yes", "y"})
+
+# CSV status flag column -> default used when the cell is empty or missing
+STATUS_FLAG_DEFAULTS: Dict[str, bool] = {
+    "featured_product": False,
+    "published_product": True,
+    "product_status": False,
+}
+
+
+def _parse_bool(value: Optional[str], default: bool = False) -> bool:
+    """Parse a CSV boolean cell, falling back to default for empty values"""
+    if not value:
+        return default
+    return value.strip().lower() in _TRUE_VALUES
+
 
 def safe_json_parse(json_str: Optional[str]) -> Optional[dict]:
     """Safely parse JSON string, returning None if string is None or empty"""
     if json_str is None or not json_str.strip():
         return None
-    try:
-        return json.loads(json_str)
-    except json.JSONDecodeError:
-        raise
+    return orjson.loads(json_str)
+
+
+def _invalidate_product_cache(product_id: str, *slugs: Optional[str]) -> None:
+    """Drop cached detail responses for a product after it changes"""
+    product_cache.delete(("id", product_id), *(("slug", slug) for slug in slugs if slug))
+
+
+# Single-product lookups are built through lambda_stmt so SQLAlchemy caches
+# the constructed statement and only rebinds the closure value per call
+def _product_by_id_stmt(product_id: str):
+    return lambda_stmt(lambda: select(Product).where(Product.product_id == product_id))
+
+
+def _product_by_slug_stmt(slug: str):
+    return lambda_stmt(lambda: select(Product).where(Product.slug == slug))
+
+
+def _keyset_page(stmt, cursor: Optional[str], limit: int, key=Product.product_id):
+    """Order by product_id after cursor, fetching one extra row to detect a next page"""
+    if cursor:
+        stmt = stmt.filter(key > cursor)
+    return stmt.order_by(key).limit(limit + 1)
+
+
+def _split_page(products: List[Product], limit: int) -> Tuple[List[Product], Optional[str]]:
+    """Trim the look-ahead row and return (page, next_cursor)"""
+    if len(products) > limit:
+        products = products[:limit]
+        return products, products[-1].product_id
+    return products, None
+
+
+async def _exists(db: AsyncSession, column, value) -> bool:
+    """Check whether any row has column == value without loading the row"""
+    return await db.scalar(select(literal(1)).where(column == value).limit(1)) is not None
 
 
 async def generate_unique_slug(product_name: str, db: AsyncSession, current_product_id: str = None) -> str:
     """Generate a unique slug from product name, excluding current product if updating"""
-    base_slug = slugify(product_name)
+    # slugify is regex/unicode heavy; keep it off the event loop
+    base_slug = await asyncio.to_thread(slugify, product_name) or FALLBACK_PRODUCT_SLUG
     slug = base_slug
     suffix = 0
     while True:
-        query = select(Product).filter(Product.slug == slug)
+        condition = Product.slug == slug
         if current_product_id:
-            query = query.filter(Product.product_id != current_product_id)
-        result = await db.execute(query)
-        if not result.scalars().first():
+            condition = condition & (Product.product_id != current_product_id)
+        result = await db.execute(select(exists().where(condition)))
+        if not result.scalar():
             break
         suffix += 1
         slug = f"{base_slug}-{suffix}"
@@ -55,6 +177,108 @@ router = APIRouter()
 
 
 
+def _build_product_fields(row: Dict[str, str]) -> dict:
+    """Build the column values for a CSV product row (pure CPU, no I/O)"""
+    product_name = row.get("product_name", "").strip()
+    if not product_name:
+        raise ValueError("Product name is required")
+
+    return {
+        "category_name": row.get("category_name", "").strip(),
+        "subcategory_name": row.get("subcategory_name", "").strip(),  # optional
+        "image_paths": [img.strip() for img in row.get("images", "").split("|") if img.strip()],
+        "identification": {
+            "product_name": product_name,
+            "product_sku": row.get("product_sku", "").strip()
+        },
+        "descriptions": {
+            "short_description": row.get("short_description", "").strip(),
+            "full_description": row.get("full_description", "").strip()
+        },
+        "pricing": {
+            "actual_price": row.get("actual_price", "").strip(),
+            "selling_price": row.get("selling_price", "").strip()
+        },
+        "inventory": {
+            "quantity": row.get("stock_quantity", "").strip(),
+            "stock_alert_status": row.get("stock_alert_status", "instock").strip()
+        },
+        "physical_attributes": {
+            "weight": row.get("weight", "").strip(),
+            "dimensions": row.get("dimensions", "{}").strip(),
+            "shipping_class": row.get("shipping_class", "standard").strip()
+        },
+        "tags_and_relationships": {
+            "product_tags": [t.strip() for t in row.get("product_tags", "").split("|") if t.strip()],
+            "linkedproductid": row.get("linkedproductid", "").strip()
+        },
+        "status_flags": {
+            flag: _parse_bool(row.get(flag), default)
+            for flag, default in STATUS_FLAG_DEFAULTS.items()
+        },
+    }
+
+
+def _prepare_csv_rows(content: bytes) -> Tuple[Set[str], List[tuple]]:
+    """
+    Parse the uploaded CSV and build the product fields of every row.
+    Runs in a worker thread; returns the missing required columns and
+    (row_num, row, fields, error) tuples. Rows are skipped entirely when
+    the header is missing a required column.
+    """
+    csv_reader = csv.DictReader(io.StringIO(content.decode("utf-8")))
+    missing_columns = REQUIRED_CSV_COLUMNS - set(csv_reader.fieldnames or [])
+    if missing_columns:
+        return missing_columns, []
+
+    rows = list(csv_reader)
+
+    # Slugify every product name in one pass ahead of the per-row work
+    base_slugs = [
+        slugify((row.get("product_name") or "").strip()) or FALLBACK_PRODUCT_SLUG
+        for row in rows
+    ]
+
+    prepared = []
+    for row_num, (row, base_slug) in enumerate(zip(rows, base_slugs), start=1):
+        try:
+            fields = _build_product_fields(row)
+            fields["base_slug"] = base_slug
+            prepared.append((row_num, row, fields, None))
+        except Exception as e:
+            prepared.append((row_num, row, None, str(e)))
+    return missing_columns, prepared
+
+
+async def _load_existing_slugs(db: AsyncSession, base_slugs: Set[str]) -> Set[str]:
+    """
+    Fetch every stored product slug that could collide with the given base slugs.
+
+    The bases and their suffix patterns go in as two array parameters, so the
+    statement has the same shape and bind count however many rows the CSV has.
+    """
+    bases = sorted(base_slug for base_slug in base_slugs if base_slug)
+    if not bases:
+        return set()
+    result = await db.execute(
+        select(Product.slug).where(
+            or_(
+                Product.slug == any_(bindparam("bases", bases, type_=ARRAY(String))),
+                Product.slug.like(
+                    any_(
+                        bindparam(
+                            "suffixed",
+                            [f"{base_slug}-%" for base_slug in bases],
+                            type_=ARRAY(String),
+                        )
+                    )
+                ),
+            )
+        )
+    )
+    return set(result.scalars().all())
+
+
 @router.post("/bulk-upload-products/")
 async def bulk_upload_products(
     file: UploadFile = File(...),
@@ -63,32 +287,42 @@ async def bulk_upload_products(
 ):
     try:
         # Validate vendor
-        result = await db.execute(
-            select(VendorLogin)
-            .options(selectinload(VendorLogin.business_profile))
-            .filter(VendorLogin.user_id == vendor_id)
+        vendor_username = await db.scalar(
+            select(VendorLogin.username).where(VendorLogin.user_id == vendor_id)
         )
-        vendor_check = result.scalars().first()
-        if not vendor_check or vendor_check.username != "unknown":
+        if vendor_username != "unknown":
             return APIResponse.response(StatusCode.NOT_FOUND, "Vendor not found", log_error=True)
 
-        # Read CSV
+        # Read CSV and build row fields off the event loop
         content = await file.read()
-        csv_reader = csv.DictReader(io.StringIO(content.decode("utf-8")))
+        missing_columns, prepared_rows = await asyncio.to_thread(_prepare_csv_rows, content)
+        if missing_columns:
+            return APIResponse.response(
+                StatusCode.BAD_REQUEST,
+                f"Missing required CSV columns: {', '.join(sorted(missing_columns))}",
+                log_error=True,
+            )
 
-        products_to_create = []
+        # One query for all slugs that could collide with this batch
+        existing_slugs = await _load_existing_slugs(
+            db, {fields["base_slug"] for _, _, fields, _ in prepared_rows if fields}
+        )
+
+        # Next suffix to try per base slug, so repeated names in the CSV
+        # don't rescan suffixes already handed out earlier in this batch
+        slug_counters: Dict[str, int] = defaultdict(int)
+
+        pending_rows = []
         failed_rows = []
-        row_num = 1
 
-        async for row in _iterate_csv(csv_reader):
-            try:
-                # Product basic info
-                product_name = row.get("product_name", "").strip()
-                if not product_name:
-                    raise ValueError("Product name is required")
+        for row_num, row, fields, error in prepared_rows:
+            if error:
+                failed_rows.append({"row": row_num, "error": error, "data": row})
+                continue
 
-                category_name = row.get("category_name", "").strip()
-                subcategory_name = row.get("subcategory_name", "").strip()  # optional
+            try:
+                category_name = fields["category_name"]
+                subcategory_name = fields["subcategory_name"]
 
                 # Resolve category_id
                 result = await db.execute(select(Category).filter(Category.category_name == category_name))
@@ -111,81 +345,66 @@ async def bulk_upload_products(
                         raise ValueError(f"Subcategory '{subcategory_name}' not valid for category '{category_name}'")
                     subcat_id = subcategory.subcategory_id
 
-                # Generate slug
-                base_slug = slugify(product_name)
-                slug = base_slug
-                suffix = 0
-                while True:
-                    res = await db.execute(select(Product).filter(Product.slug == slug))
-                    if not res.scalars().first():
-                        break
+                # Generate slug against the preloaded slug set
+                base_slug = fields["base_slug"]
+                suffix = slug_counters[base_slug]
+                slug = f"{base_slug}-{suffix}" if suffix else base_slug
+                while slug in existing_slugs:
                     suffix += 1
                     slug = f"{base_slug}-{suffix}"
+                existing_slugs.add(slug)
+                slug_counters[base_slug] = suffix + 1
 
-                # Generate product_id
-                product_id = generate_lowercase(6)
-
-                # Handle images
-                images = [img.strip() for img in row.get("images", "").split("|") if img.strip()]
-                image_urls = []
-                for img_path in images:
-                    async with aiofiles.open(img_path, 'rb') as f:
-                        file_bytes = await f.read()
-                        filename = os.path.basename(img_path)
-                        url = await upload_file_to_s3(file_bytes, file_path=f"products/{filename}")
-                        image_urls.append(url)
-
-                # Build product
-                db_product = Product(
-                    product_id=product_id,
-                    vendor_id=vendor_id,
-                    category_id=cat_id,
-                    subcategory_id=subcat_id,
-                    slug=slug,
-                    identification={
-                        "product_name": product_name,
-                        "product_sku": row.get("product_sku", "").strip()
-                    },
-                    descriptions={
-                        "short_description": row.get("short_description", "").strip(),
-                        "full_description": row.get("full_description", "").strip()
-                    },
-                    pricing={
-                        "actual_price": row.get("actual_price", "").strip(),
-                        "selling_price": row.get("selling_price", "").strip()
-                    },
-                    inventory={
-                        "quantity": row.get("stock_quantity", "").strip(),
-                        "stock_alert_status": row.get("stock_alert_status", "instock").strip()
-                    },
-                    physical_attributes={
-                        "weight": row.get("weight", "").strip(),
-                        "dimensions": row.get("dimensions", "{}").strip(),
-                        "shipping_class": row.get("shipping_class", "standard").strip()
-                    },
-                    images={"urls": image_urls},
-                    tags_and_relationships={
-                        "product_tags": [t.strip() for t in row.get("product_tags", "").split("|") if t.strip()],
-                        "linkedproductid": row.get("linkedproductid", "").strip()
-                    },
-                    status_flags={
-                        "featured_product": row.get("featured_product", "false").lower() == "true",
-                        "published_product": row.get("published_product", "true").lower() == "true",
-                        "product_status": row.get("product_status", "false").lower() == "true"
-                    }
-                )
-
-                products_to_create.append(db_product)
+                pending_rows.append((row_num, row, fields, cat_id, subcat_id, slug))
 
             except Exception as e:
                 failed_rows.append({"row": row_num, "error": str(e), "data": row})
 
-            row_num += 1
+        # Upload images for all rows concurrently, bounded by the semaphore
+        upload_semaphore = asyncio.Semaphore(IMAGE_UPLOAD_CONCURRENCY)
+
+        async def _upload_image(img_path: str) -> str:
+            async with upload_semaphore:
+                filename = os.path.basename(img_path)
+                async with aiofiles.open(img_path, 'rb') as f:
+                    return await upload_fileobj_to_s3(f, file_path=f"products/{filename}")
+
+        async def _handle_row(fields: dict, cat_id: str, subcat_id: Optional[str], slug: str) -> Product:
+            image_urls = await asyncio.gather(*(_upload_image(p) for p in fields["image_paths"]))
+            return Product(
+                product_id=generate_lowercase(6),
+                vendor_id=vendor_id,
+                category_id=cat_id,
+                subcategory_id=subcat_id,
+                slug=slug,
+                identification=fields["identification"],
+                descriptions=fields["descriptions"],
+                pricing=fields["pricing"],
+                inventory=fields["inventory"],
+                physical_attributes=fields["physical_attributes"],
+                images={"urls": list(image_urls)},
+                tags_and_relationships=fields["tags_and_relationships"],
+                status_flags=fields["status_flags"],
+            )
+
+        results = await asyncio.gather(
+            *(_handle_row(fields, cat_id, subcat_id, slug) for _, _, fields, cat_id, subcat_id, slug in pending_rows),
+            return_exceptions=True,
+        )
+
+        products_to_create = []
+        for (row_num, row, *_), outcome in zip(pending_rows, results):
+            if isinstance(outcome, Exception):
+                failed_rows.append({"row": row_num, "error": str(outcome), "data": row})
+            else:
+                products_to_create.append(outcome)
+        failed_rows.sort(key=lambda failed: failed["row"])
 
         # Bulk insert
         if products_to_create:
             db.add_all(products_to_create)
             await db.commit()
+            product_count_cache.clear()
 
         return {
             "success_count": len(products_to_create),
@@ -193,6 +412,8 @@ async def bulk_upload_products(
             "failed_rows": failed_rows
         }
 
+    except HTTPException:
+        raise
     except IntegrityError as e:
         await db.rollback()
         return APIResponse.response(StatusCode.BAD_REQUEST, f"Integrity error: {str(e)}", log_error=True)
@@ -201,12 +422,6 @@ async def bulk_upload_products(
         return APIResponse.response(StatusCode.SERVER_ERROR, f"Unexpected error: {str(e)}", log_error=True)
 
 
-async def _iterate_csv(reader):
-    """Helper to simulate async loop over CSV"""
-    for row in reader:
-        yield row
-
-
 
 # @router.post("/bulk-upload-products/")
 # async def bulk_upload_products(
@@ -378,17 +593,14 @@ async def create_product(
 ):
     try:
         # Validate vendor
-        result = await db.execute(
-            select(VendorLogin)
-            .options(selectinload(VendorLogin.business_profile))
-            .filter(VendorLogin.user_id == vendor_id)
+        vendor_username = await db.scalar(
+            select(VendorLogin.username).where(VendorLogin.user_id == vendor_id)
         )
-        vendor_check = result.scalars().first()
-        if not vendor_check:
+        if vendor_username is None:
             return APIResponse.response(StatusCode.NOT_FOUND, "Vendor not found", log_error=True)
         
         # Check if username is "unknown" (vendor) vs vendor employee
-        if vendor_check.username != "unknown":
+        if vendor_username != "unknown":
             return APIResponse.response(StatusCode.NOT_FOUND, "Vendor not found", log_error=True)
 
         # Validate category
@@ -416,14 +628,14 @@ async def create_product(
 
         # Parse JSON fields
         try:
-            identification_data = json.loads(identification)
-            descriptions_data = json.loads(descriptions) if descriptions else {}
-            pricing_data = json.loads(pricing) if pricing else {}
-            inventory_data = json.loads(inventory) if inventory else {}
-            physical_attributes_data = json.loads(physical_attributes) if physical_attributes else {}
-            tags_and_relationships_data = json.loads(tags_and_relationships) if tags_and_relationships else {}
-            status_flags_data = json.loads(status_flags) if status_flags else {}
-        except json.JSONDecodeError as e:
+            identification_data = orjson.loads(identification)
+            descriptions_data = orjson.loads(descriptions) if descriptions else {}
+            pricing_data = orjson.loads(pricing) if pricing else {}
+            inventory_data = orjson.loads(inventory) if inventory else {}
+            physical_attributes_data = orjson.loads(physical_attributes) if physical_attributes else {}
+            tags_and_relationships_data = orjson.loads(tags_and_relationships) if tags_and_relationships else {}
+            status_flags_data = orjson.loads(status_flags) if status_flags else {}
+        except orjson.JSONDecodeError as e:
             return APIResponse.response(StatusCode.BAD_REQUEST, f"Invalid JSON data: {str(e)}", log_error=True)
 
         # Validate product name
@@ -441,25 +653,20 @@ async def create_product(
             return APIResponse.response(StatusCode.BAD_REQUEST, "At least one valid product image is required", log_error=True)
 
         # Generate unique slug
-        base_slug = slugify(product_name)
-        slug = base_slug
-        suffix = 0
-        while True:
-            result = await db.execute(select(Product).filter(Product.slug == slug))
-            if not result.scalars().first():
-                break
-            suffix += 1
-            slug = f"{base_slug}-{suffix}"
+        slug = await generate_unique_slug(product_name, db)
 
         # Generate product_id
         product_id = generate_lowercase(6)
 
-        # Save uploaded images
-        image_urls = []
-        for file in valid_files:
-            sub_path = f"products/{cat_id}/{slug}"
-            uploaded_url = await save_uploaded_file(file, sub_path)
-            image_urls.append(uploaded_url)
+        # Save uploaded images concurrently (gather keeps the input order)
+        sub_path = f"products/{cat_id}/{slug}"
+        upload_semaphore = asyncio.Semaphore(IMAGE_UPLOAD_CONCURRENCY)
+
+        async def _save(upload: UploadFile) -> str:
+            async with upload_semaphore:
+                return await save_uploaded_file(upload, sub_path)
+
+        image_urls = list(await asyncio.gather(*(_save(f) for f in valid_files)))
 
         # Create product
         db_product = Product(
@@ -507,16 +714,13 @@ async def create_product(
 
         db.add(db_product)
         await db.commit()
+        product_count_cache.clear()
         await db.refresh(db_product)
 
-        # Prepare response
+        # Prepare response; store_name was filled in by the product trigger
         category_name = category.category_name
         subcategory_name = subcategory.subcategory_name if subcategory else None
-        
-        # Get store_name from business profile
-        store_name = None
-        if vendor_check and vendor_check.business_profile:
-            store_name = vendor_check.business_profile.store_name
+        store_name = db_product.store_name
 
         response_data = ProductResponse(
             product_id=db_product.product_id,
@@ -546,6 +750,52 @@ async def create_product(
         await db.rollback()
         return APIResponse.response(StatusCode.SERVER_ERROR, f"Unexpected error: {str(e)}", log_error=True)
 
+def _product_list_item(product: Product) -> dict:
+    """Build the ProductResponse payload for a product listing row"""
+    images = product.images
+    if images and "urls" in images:
+        images = {"urls": get_media_urls(images["urls"])}
+
+    return {
+        "product_id": product.product_id,
+        "store_name": product.store_name,
+        "slug": product.slug,
+        "identification": product.identification,
+        "descriptions": product.descriptions,
+        "pricing": product.pricing,
+        "inventory": product.inventory,
+        "physical_attributes": product.physical_attributes,
+        "images": images,
+        "tags_and_relationships": product.tags_and_relationships,
+        "status_flags": product.status_flags,
+        "timestamp": product.timestamp,
+        "category_id": product.category_id,
+        "category_name": product.category_name,
+        "subcategory_id": product.subcategory_id,
+        "subcategory_name": product.subcategory_name,
+    }
+
+
+async def _stream_all_products(total_count: int) -> AsyncGenerator[bytes, None]:
+    """Yield the product list as a JSON document, one product at a time"""
+    stmt = select(Product).options(raiseload("*")).execution_options(yield_per=PRODUCT_STREAM_BATCH_SIZE)
+
+    yield b'{"products":['
+    # The request-scoped session is closed before the body is streamed,
+    # so the cursor runs on a session owned by the generator.
+    async with AsyncSessionLocal() as session:
+        try:
+            result = await session.stream(stmt)
+            separator = b""
+            async for product in result.scalars():
+                yield separator + orjson.dumps(_product_list_item(product))
+                separator = b","
+        except Exception:
+            logger.exception("Failed while streaming products")
+            raise
+    yield b'],"total_count":' + str(total_count).encode() + b"}"
+
+
 @router.get("/", response_model=ProductListResponse, status_code=200)
 async def get_all_products(db: AsyncSession = Depends(get_db)):
     try:
@@ -553,59 +803,81 @@ async def get_all_products(db: AsyncSession = Depends(get_db)):
         count_result = await db.execute(select(func.count(Product.product_id)))
         total_count = count_result.scalar()
 
-        # Get all products with category, subcategory, and vendor business profile information
-        result = await db.execute(
-            select(Product, VendorLogin, BusinessProfile)
-            .join(VendorLogin, Product.vendor_id == VendorLogin.user_id)
-            .join(BusinessProfile, VendorLogin.business_profile_id == BusinessProfile.profile_ref_id)
-            .options(
-                selectinload(Product.category),
-                selectinload(Product.subcategory)
-            )
+        return StreamingResponse(
+            _stream_all_products(total_count),
+            media_type="application/json",
         )
-        products_data = result.all()
 
-        if not products_data:
-            return ProductListResponse(products=[], total_count=0)
+    except Exception as e:
+        return APIResponse.response(
+            StatusCode.SERVER_ERROR,
+            f"Failed to retrieve products: {str(e)}",
+            log_error=True,
+        )
 
-        # Convert ORM objects to response-ready dicts
-        product_responses = []
-        for product, vendor_login, business_profile in products_data:
-            product_data = product.__dict__.copy()
-            
-            # Remove internal SQLAlchemy state
-            product_data.pop("_sa_instance_state", None)
+async def _approximate_product_count(db: AsyncSession) -> int:
+    """Planner row estimate for the products table, exact count if never analyzed"""
+    result = await db.execute(
+        text("SELECT reltuples::bigint FROM pg_class WHERE relname = :table"),
+        {"table": Product.__tablename__},
+    )
+    estimate = result.scalar()
+    if estimate is None or estimate < 0:
+        result = await db.execute(select(func.count(Product.product_id)))
+        return result.scalar()
+    return estimate
 
-            product_data["category_id"] = product.category_id
-            product_data["category_name"] = (
-                product.category.category_name if product.category else None
-            )
-            product_data["subcategory_id"] = product.subcategory_id
-            product_data["subcategory_name"] = (
-                product.subcategory.subcategory_name if product.subcategory else None
-            )
-            
-            # Add store_name from business profile
-            product_data["store_name"] = business_profile.store_name if business_profile else None
-            
-            # Remove vendor_id from response
-            product_data.pop("vendor_id", None)
 
-            # Process image URLs
-            if product.images and "urls" in product.images:
-                image_urls = [get_media_url(url) for url in product.images["urls"]]
-                product_data["images"] = {"urls": image_urls}
+class _ExplainJson(Executable, ClauseElement):
+    """EXPLAIN (FORMAT JSON) around a statement; its binds stay parameters"""
 
-            product_responses.append(ProductResponse(**product_data))
+    inherit_cache = False
 
-        return ProductListResponse(products=product_responses, total_count=total_count)
+    def __init__(self, stmt):
+        self.stmt = stmt
 
-    except Exception as e:
-        return APIResponse.response(
-            StatusCode.SERVER_ERROR,
-            f"Failed to retrieve products: {str(e)}",
-            log_error=True,
+
+@compiles(_ExplainJson, "postgresql")
+def _compile_explain_json(element, compiler, **kw):
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.stmt, **kw)
+
+
+async def _estimated_count(db: AsyncSession, stmt) -> int:
+    """
+    Row count for ``stmt``: exact up to SEARCH_COUNT_CAP, approximate above it.
+
+    Rows are counted exactly up to one past the cap in a single round trip.
+    Only a larger result asks the planner for its row estimate, so a big
+    filtered set is never scanned in full just to report a pagination total.
+    """
+    capped = await db.scalar(
+        select(func.count(literal(1))).select_from(
+            stmt.limit(SEARCH_COUNT_CAP + 1).subquery()
         )
+    )
+    if capped <= SEARCH_COUNT_CAP:
+        return capped
+
+    plan = await db.scalar(_ExplainJson(stmt))
+    if isinstance(plan, (str, bytes)):
+        plan = orjson.loads(plan)
+    # The estimate can undershoot; the result is known to exceed the cap
+    return max(int(plan[0]["Plan"]["Plan Rows"]), capped)
+
+
+def _search_item(product: Product) -> ProductSearchResponse:
+    """Build a search result entry from a product row"""
+    urls = (product.images or _EMPTY).get("urls")
+    selling_price = (product.pricing or _EMPTY).get("selling_price")
+    return ProductSearchResponse(
+        product_id=product.product_id,
+        product_name=(product.identification or _EMPTY).get("product_name", ""),
+        product_image=get_media_url(urls[0]) if urls else None,
+        product_pricing=selling_price or None,
+        slug=product.slug,
+        category=product.category_name
+    )
+
 
 @router.get("/search", response_model=ProductSearchListResponse, status_code=200)
 async def search_products(db: AsyncSession = Depends(get_db)):
@@ -613,44 +885,17 @@ async def search_products(db: AsyncSession = Depends(get_db)):
     try:
         # Build the query to get 10 products
         query = (
-            select(Product, Category.category_name.label("category_name"))
-            .join(Category, Product.category_id == Category.category_id)
+            select(Product)
+            .options(load_only(*SEARCH_ITEM_COLUMNS), raiseload("*"))
             .limit(10)
         )
         
-        # Get total count of all products
-        count_query = select(func.count(Product.product_id))
-        count_result = await db.execute(count_query)
-        total_count = count_result.scalar()
+        # Planner estimate instead of a full count(*) scan per request
+        total_count = await _approximate_product_count(db)
         
         # Execute the main query
         result = await db.execute(query)
-        products_data = result.all()
-        
-        # Format the response
-        products = []
-        for product, category_name in products_data:
-            # Extract product image (first available image)
-            product_image = None
-            if product.images and "urls" in product.images and product.images["urls"]:
-                product_image = get_media_url(product.images["urls"][0])
-            
-            # Extract pricing
-            product_pricing = None
-            if product.pricing and product.pricing.get("selling_price"):
-                product_pricing = product.pricing["selling_price"]
-            
-            # Extract product name
-            product_name = product.identification.get("product_name", "")
-            
-            products.append(ProductSearchResponse(
-                product_id=product.product_id,
-                product_name=product_name,
-                product_image=product_image,
-                product_pricing=product_pricing,
-                slug=product.slug,
-                category=category_name
-            ))
+        products = [_search_item(product) for product in result.scalars()]
         
         return ProductSearchListResponse(
             products=products,
@@ -674,61 +919,37 @@ async def search_products_by_name(
         if product_name:
             # Build the query to search products by name with prefix matching
             query = (
-                select(Product, Category.category_name.label("category_name"))
-                .join(Category, Product.category_id == Category.category_id)
+                select(Product)
+                .options(load_only(*SEARCH_ITEM_COLUMNS), raiseload("*"))
                 .where(Product.identification["product_name"].astext.ilike(f"{product_name}%"))
                 .order_by(Product.timestamp.desc())
                 .limit(10)
             )
             
-            # Get total count of matching products
-            count_query = (
-                select(func.count(Product.product_id))
-                .join(Category, Product.category_id == Category.category_id)
+            # Count matches up to SEARCH_COUNT_CAP rather than scanning them all
+            capped_matches = (
+                select(Product.product_id)
                 .where(Product.identification["product_name"].astext.ilike(f"{product_name}%"))
+                .limit(SEARCH_COUNT_CAP)
+                .subquery()
             )
+            count_result = await db.execute(select(func.count()).select_from(capped_matches))
+            total_count = count_result.scalar()
         else:
             # Build the query to get latest 10 products when no search term provided
             query = (
-                select(Product, Category.category_name.label("category_name"))
-                .join(Category, Product.category_id == Category.category_id)
+                select(Product)
+                .options(load_only(*SEARCH_ITEM_COLUMNS), raiseload("*"))
                 .order_by(Product.timestamp.desc())
                 .limit(10)
             )
             
-            # Get total count of all products
-            count_query = select(func.count(Product.product_id))
-        count_result = await db.execute(count_query)
-        total_count = count_result.scalar()
+            # Planner estimate instead of a full count(*) scan per request
+            total_count = await _approximate_product_count(db)
         
         # Execute the main query
         result = await db.execute(query)
-        products_data = result.all()
-        
-        # Format the response
-        products = []
-        for product, category_name in products_data:
-            # Extract product image (first available image)
-            product_image = None
-            if product.images and "urls" in product.images and product.images["urls"]:
-                product_image = get_media_url(product.images["urls"][0])
-            
-            # Extract pricing
-            product_pricing = None
-            if product.pricing and product.pricing.get("selling_price"):
-                product_pricing = product.pricing["selling_price"]
-            
-            # Extract product name
-            product_name_value = product.identification.get("product_name", "")
-            
-            products.append(ProductSearchResponse(
-                product_id=product.product_id,
-                product_name=product_name_value,
-                product_image=product_image,
-                product_pricing=product_pricing,
-                slug=product.slug,
-                category=category_name
-            ))
+        products = [_search_item(product) for product in result.scalars()]
         
         return ProductSearchListResponse(
             products=products,
@@ -744,41 +965,31 @@ async def search_products_by_name(
 
 @router.get("/{product_id}", response_model=ProductResponse, status_code=200)
 async def get_product_by_id(product_id: str, db: AsyncSession = Depends(get_db)):
+    cached = product_cache.get(("id", product_id))
+    if cached is not None:
+        return cached
+
     try:
-        result = await db.execute(
-            select(Product, VendorLogin, BusinessProfile)
-            .join(VendorLogin, Product.vendor_id == VendorLogin.user_id)
-            .join(BusinessProfile, VendorLogin.business_profile_id == BusinessProfile.profile_ref_id)
-            .filter(Product.product_id == product_id)
-        )
-        product_data = result.first()
+        result = await db.execute(_product_by_id_stmt(product_id))
+        product = result.scalars().first()
 
-        if not product_data:
+        if not product:
             return APIResponse.response(
                 StatusCode.NOT_FOUND,
                 f"Product with ID {product_id} not found",
                 log_error=False,
             )
-        
-        product, vendor_login, business_profile = product_data
-
-        # Fetch category/subcategory names
-        category_result = await db.execute(select(Category.category_name).where(Category.category_id == product.category_id))
-        category_name = category_result.scalar()
-
-        subcategory_result = await db.execute(select(SubCategory.subcategory_name).where(SubCategory.subcategory_id == product.subcategory_id))
-        subcategory_name = subcategory_result.scalar()
 
         # Process image URLs
         processed_images = product.images
         if product.images and "urls" in product.images:
-            image_urls = [get_media_url(url) for url in product.images["urls"]]
+            image_urls = get_media_urls(product.images["urls"])
             processed_images = {"urls": image_urls}
 
         # Build and return ProductResponse
         product_response = ProductResponse(
             product_id=product.product_id,
-            store_name=business_profile.store_name if business_profile else None,
+            store_name=product.store_name,
             slug=product.slug,
             identification=product.identification,
             descriptions=product.descriptions,
@@ -790,10 +1001,12 @@ async def get_product_by_id(product_id: str, db: AsyncSession = Depends(get_db))
             status_flags=product.status_flags,
             timestamp=product.timestamp,
             category_id=product.category_id,
-            category_name=category_name,
+            category_name=product.category_name,
             subcategory_id=product.subcategory_id,
-            subcategory_name=subcategory_name,
+            subcategory_name=product.subcategory_name,
         )
+        product_cache.set(("id", product.product_id), product_response)
+        product_cache.set(("slug", product.slug), product_response)
         return product_response
 
     except Exception as e:
@@ -808,37 +1021,30 @@ async def get_product_by_id(product_id: str, db: AsyncSession = Depends(get_db))
 
 @router.get("/slug/{slug}", response_model=ProductResponse, status_code=200)
 async def get_product_by_slug(slug: str, db: AsyncSession = Depends(get_db)):
+    cached = product_cache.get(("slug", slug))
+    if cached is not None:
+        return cached
+
     try:
-        result = await db.execute(
-            select(Product, VendorLogin, BusinessProfile)
-            .join(VendorLogin, Product.vendor_id == VendorLogin.user_id)
-            .join(BusinessProfile, VendorLogin.business_profile_id == BusinessProfile.profile_ref_id)
-            .where(Product.slug == slug)
-            .options(
-                selectinload(Product.category),
-                selectinload(Product.subcategory)
-            )
-        )
-        product_data = result.first()
+        result = await db.execute(_product_by_slug_stmt(slug))
+        product = result.scalars().first()
 
-        if not product_data:
+        if not product:
             return APIResponse.response(
                 StatusCode.NOT_FOUND,
                 f"Product with slug '{slug}' not found",
                 log_error=False,
             )
-        
-        product, vendor_login, business_profile = product_data
 
         # Process image URLs
         processed_images = product.images
         if product.images and "urls" in product.images:
-            image_urls = [get_media_url(url) for url in product.images["urls"]]
+            image_urls = get_media_urls(product.images["urls"])
             processed_images = {"urls": image_urls}
 
-        return ProductResponse(
+        product_response = ProductResponse(
             product_id=product.product_id,
-            store_name=business_profile.store_name if business_profile else None,
+            store_name=product.store_name,
             slug=product.slug,
             identification=product.identification,
             descriptions=product.descriptions,
@@ -850,10 +1056,13 @@ async def get_product_by_slug(slug: str, db: AsyncSession = Depends(get_db)):
             status_flags=product.status_flags,
             timestamp=product.timestamp,
             category_id=product.category_id,
-            category_name=product.category.category_name if product.category else None,
+            category_name=product.category_name,
             subcategory_id=product.subcategory_id,
-            subcategory_name=product.subcategory.subcategory_name if product.subcategory else None,
+            subcategory_name=product.subcategory_name,
         )
+        product_cache.set(("id", product.product_id), product_response)
+        product_cache.set(("slug", product.slug), product_response)
+        return product_response
 
     except Exception as e:
         return APIResponse.response(
@@ -866,82 +1075,53 @@ async def get_product_by_slug(slug: str, db: AsyncSession = Depends(get_db)):
 @router.get("/by-vendor/{store_slug}", response_model=List[ProductResponse])
 async def get_products_by_store_slug(
     store_slug: str,
+    limit: int = Query(PRODUCT_PAGE_SIZE, ge=1, le=PRODUCT_PAGE_SIZE_MAX),
+    cursor: Optional[str] = Query(None, description="next_cursor from the X-Next-Cursor header of the previous page"),
     db: AsyncSession = Depends(get_db),
 ):
     try:
-        # First, find the vendor_id using the store_slug
-        business_profile_result = await db.execute(
-            select(BusinessProfile)
-            .filter(BusinessProfile.store_slug == store_slug)
-        )
-        business_profile = business_profile_result.scalar_one_or_none()
-        
-        if not business_profile:
-            raise HTTPException(
-                status_code=404,
-                detail=f"No store found with slug: {store_slug}"
-            )
-        
-        # Get the vendor_id from the business profile
-        vendor_result = await db.execute(
-            select(VendorLogin)
-            .filter(VendorLogin.business_profile_id == business_profile.profile_ref_id)
-        )
-        vendor = vendor_result.scalar_one_or_none()
-        
-        if not vendor:
-            raise HTTPException(
-                status_code=404,
-                detail=f"No vendor found for store slug: {store_slug}"
-            )
-        
-        # Now get products using the vendor_id
+        # Products resolved through vendor and store profile in a single query
         result = await db.execute(
-            select(Product)
-            .options(
-                selectinload(Product.category),
-                selectinload(Product.subcategory),
+            _keyset_page(
+                select(Product)
+                .options(raiseload("*"))
+                .join(VendorLogin, Product.vendor_id == VendorLogin.user_id)
+                .join(BusinessProfile, VendorLogin.business_profile_id == BusinessProfile.profile_ref_id)
+                .filter(BusinessProfile.store_slug == store_slug),
+                cursor,
+                limit,
             )
-            .filter(Product.vendor_id == vendor.user_id)
         )
-        products = result.scalars().all()
-
-        if not products:
+        products, next_cursor = _split_page(result.scalars().all(), limit)
+
+        if not products and not cursor:
+            # Only an empty result needs to tell a missing store from an empty one
+            store_result = await db.execute(
+                select(BusinessProfile.profile_ref_id, VendorLogin.user_id)
+                .outerjoin(VendorLogin, VendorLogin.business_profile_id == BusinessProfile.profile_ref_id)
+                .filter(BusinessProfile.store_slug == store_slug)
+            )
+            store = store_result.first()
+            if not store:
+                raise HTTPException(
+                    status_code=404,
+                    detail=f"No store found with slug: {store_slug}"
+                )
+            if not store.user_id:
+                raise HTTPException(
+                    status_code=404,
+                    detail=f"No vendor found for store slug: {store_slug}"
+                )
             raise HTTPException(
                 status_code=404,
                 detail=f"No products found for store: {store_slug}"
             )
 
-        # Map products into the correct response model
-        response = []
-        for product in products:
-            image_urls = []
-            if product.images and "urls" in product.images:
-                image_urls = [get_media_url(url) for url in product.images["urls"]]
-
-            response.append(
-                ProductResponse(
-                    product_id=product.product_id,
-                    store_name=business_profile.store_name,
-                    slug=product.slug,
-                    identification=product.identification,
-                    descriptions=product.descriptions,
-                    pricing=product.pricing,
-                    inventory=product.inventory,
-                    physical_attributes=product.physical_attributes,
-                    
-                    tags_and_relationships=product.tags_and_relationships,
-                    status_flags=product.status_flags,
-                    images={"urls": image_urls} if image_urls else None,
-                    timestamp=product.timestamp,
-                    category_id=product.category_id,
-                    category_name=product.category.category_name if product.category else None,
-                    subcategory_id=product.subcategory_id,
-                    subcategory_name=product.subcategory.subcategory_name if product.subcategory else None,
-                )
-            )
-
-        return response
+        # Dicts go straight to orjson, skipping per-row model validation
+        return ORJSONResponse(
+            [_product_list_item(product) for product in products],
+            headers={"X-Next-Cursor": next_cursor} if next_cursor else None,
+        )
 
     except HTTPException:
         # Re-raise HTTPException (like our 404) without modification
@@ -956,6 +1136,8 @@ async def get_products_by_store_slug(
 @router.get("/by-vendor-id/{vendor_id}", response_model=VendorProductsResponse)
 async def get_products_by_vendor_id(
     vendor_id: str,
+    limit: int = Query(PRODUCT_PAGE_SIZE, ge=1, le=PRODUCT_PAGE_SIZE_MAX),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
     db: AsyncSession = Depends(get_db),
 ):
     try:
@@ -975,60 +1157,32 @@ async def get_products_by_vendor_id(
         
         vendor_login, business_profile = vendor_data
         
-        # Get products for this vendor
+        # Get products for this vendor; the business profile loaded above is
+        # reused instead of being joined onto every product row
         result = await db.execute(
-            select(Product, VendorLogin, BusinessProfile)
-            .join(VendorLogin, Product.vendor_id == VendorLogin.user_id)
-            .join(BusinessProfile, VendorLogin.business_profile_id == BusinessProfile.profile_ref_id)
-            .options(
-                selectinload(Product.category),
-                selectinload(Product.subcategory),
-            )
-            .filter(Product.vendor_id == vendor_id)
+            _keyset_page(select(Product).options(raiseload("*")).filter(Product.vendor_id == vendor_id), cursor, limit)
         )
-        products_data = result.all()
-
-        # Map products into the correct response model
-        products_list = []
-        for product, vendor_login, business_profile in products_data:
-            image_urls = []
-            if product.images and "urls" in product.images:
-                image_urls = [get_media_url(url) for url in product.images["urls"]]
-
-            products_list.append(
-                ProductResponse(
-                    product_id=product.product_id,
-                    # banner_image=get_media_url(business_profile.business_logo) if business_profile else None,
-                    # banner_title=business_profile.banner_title if business_profile else None,
-                    # banner_subtitle=business_profile.banner_subtitle if business_profile else None,
-                    store_name=business_profile.store_name if business_profile else None,
-                    slug=product.slug,
-                    identification=product.identification,
-                    descriptions=product.descriptions,
-                    pricing=product.pricing,
-                    inventory=product.inventory,
-                    physical_attributes=product.physical_attributes,
-                    tags_and_relationships=product.tags_and_relationships,
-                    status_flags=product.status_flags,
-                    images={"urls": image_urls} if image_urls else None,
-                    timestamp=product.timestamp,
-                    category_id=product.category_id,
-                    category_name=product.category.category_name if product.category else None,
-                    subcategory_id=product.subcategory_id,
-                    subcategory_name=product.subcategory.subcategory_name if product.subcategory else None,
-                )
-            )
+        products, next_cursor = _split_page(result.scalars().all(), limit)
 
-        # Return vendor details with products (empty list if no products)
-        return VendorProductsResponse(
-            vendor_id=vendor_id,
-            store_name=business_profile.store_name if business_profile else None,
-            banner_image=get_media_url(business_profile.business_logo) if business_profile and business_profile.business_logo else None,
-            banner_title=business_profile.banner_title if business_profile else None,
-            banner_subtitle=business_profile.banner_subtitle if business_profile else None,
-            products=products_list,
-            total_count=len(products_list)
+        count_result = await db.execute(
+            select(func.count(Product.product_id)).filter(Product.vendor_id == vendor_id)
         )
+        total_count = count_result.scalar()
+
+        # Dicts go straight to orjson, skipping per-row model validation
+        products_list = [_product_list_item(product) for product in products]
+
+        # Return vendor details with products (empty list if no products)
+        return ORJSONResponse({
+            "vendor_id": vendor_id,
+            "store_name": business_profile.store_name if business_profile else None,
+            "banner_image": get_media_url(business_profile.business_logo) if business_profile and business_profile.business_logo else None,
+            "banner_title": business_profile.banner_title if business_profile else None,
+            "banner_subtitle": business_profile.banner_subtitle if business_profile else None,
+            "products": products_list,
+            "total_count": total_count,
+            "next_cursor": next_cursor,
+        })
 
     except HTTPException:
         # Re-raise HTTPException (like our 404) without modification
@@ -1041,6 +1195,161 @@ async def get_products_by_vendor_id(
 
 
 
+# JSON sections of a product that update endpoints merge into
+PRODUCT_JSON_SECTIONS = (
+    "identification",
+    "descriptions",
+    "pricing",
+    "inventory",
+    "physical_attributes",
+    "tags_and_relationships",
+    "status_flags",
+)
+
+
+def _collect_product_patch(data: Optional[str], fields: Dict[str, Optional[str]]) -> Dict[str, dict]:
+    """
+    Gather the non-empty JSON sections sent with a product update.
+
+    ``data`` carries every section in one JSON object and is decoded once;
+    the per-section form fields are still accepted and only parsed for
+    sections ``data`` doesn't provide.
+    """
+    patch = orjson.loads(data) if data and data.strip() else {}
+    if not isinstance(patch, dict):
+        raise orjson.JSONDecodeError("Expected a JSON object", data, 0)
+
+    sections = {}
+    for section in PRODUCT_JSON_SECTIONS:
+        values = patch.get(section)
+        if values is None:
+            values = safe_json_parse(fields.get(section))
+        if not values:
+            continue
+        if not isinstance(values, dict):
+            raise orjson.JSONDecodeError(f"'{section}' must be a JSON object", data or "", 0)
+        sections[section] = values
+    return sections
+
+
+async def _apply_product_update(
+    db: AsyncSession,
+    current,
+    path_segment: str,
+    cat_id: Optional[str],
+    subcat_id: Optional[str],
+    patch: Dict[str, dict],
+    files: Optional[List[UploadFile]],
+) -> Product:
+    """
+    Write a product update without loading the ORM object.
+
+    JSON sections are merged server-side with ``||`` and the category /
+    subcategory existence checks are folded into the WHERE clause, so a
+    field edit is a single UPDATE. Images are only uploaded once that
+    UPDATE has matched, then stored with a second UPDATE. The updated row
+    comes back through RETURNING, so no reload is needed afterwards.
+    """
+    product = None
+    values = {
+        section: func.coalesce(getattr(Product, section), text("'{}'::jsonb")).op("||")(literal(section_data, JSONB))
+        for section, section_data in patch.items()
+    }
+    if cat_id:
+        values["category_id"] = cat_id
+    if subcat_id:
+        values["subcategory_id"] = subcat_id
+
+    # Update slug if product name was changed
+    product_name = current.product_name or ""
+    identification_data = patch.get("identification")
+    if identification_data and "product_name" in identification_data:
+        product_name = identification_data["product_name"]
+        new_product_name = product_name.strip()
+        if new_product_name:
+            values["slug"] = await generate_unique_slug(new_product_name, db, current.product_id)
+
+    if values:
+        condition = Product.product_id == current.product_id
+        if cat_id:
+            condition = condition & exists().where(Category.category_id == cat_id)
+        if subcat_id:
+            condition = condition & exists().where(SubCategory.subcategory_id == subcat_id)
+
+        result = await db.execute(
+            update(Product)
+            .where(condition)
+            .values(values)
+            .returning(Product)
+            .execution_options(synchronize_session=False)
+        )
+        product = result.scalars().first()
+        if product is None:
+            # Only a failed update pays for working out which check failed
+            if cat_id and not await _exists(db, Category.category_id, cat_id):
+                raise HTTPException(status_code=404, detail="Category not found")
+            if subcat_id and not await _exists(db, SubCategory.subcategory_id, subcat_id):
+                raise HTTPException(status_code=404, detail="Subcategory not found")
+            raise HTTPException(status_code=404, detail="Product not found")
+
+    if files:
+        product_name = product_name.replace(" ", "_").lower()
+        timestamp = datetime.utcnow().strftime("%Y%m%d%H%M%S")
+        upload_semaphore = asyncio.Semaphore(IMAGE_UPLOAD_CONCURRENCY)
+        file_paths = [
+            f"products/{product_name}/{path_segment}/{timestamp}_{file.filename}"
+            for file in files
+        ]
+
+        async def _upload(file: UploadFile, file_path: str) -> str:
+            async with upload_semaphore:
+                # Stream the spooled upload instead of reading it into memory
+                return await upload_fileobj_to_s3(
+                    file.file,
+                    file_path=file_path,
+                    file_type=file.content_type
+                )
+
+        # Every upload runs to completion, so the ones that landed can be
+        # removed again if another fails or the images can't be stored
+        outcomes = await asyncio.gather(
+            *(_upload(f, path) for f, path in zip(files, file_paths)),
+            return_exceptions=True,
+        )
+        uploaded_paths = [
+            path for path, outcome in zip(file_paths, outcomes)
+            if not isinstance(outcome, BaseException)
+        ]
+        failed = next((o for o in outcomes if isinstance(o, BaseException)), None)
+        if failed is not None:
+            await asyncio.gather(*(remove_file_if_exists(path) for path in uploaded_paths))
+            logger.error("Failed to upload product images: %s", failed)
+            raise HTTPException(
+                status_code=500,
+                detail=f"Failed to upload images: {getattr(failed, 'detail', failed)}",
+            )
+
+        try:
+            result = await db.execute(
+                update(Product)
+                .where(Product.product_id == current.product_id)
+                .values(images={"urls": list(outcomes)})
+                .returning(Product)
+                .execution_options(synchronize_session=False, populate_existing=True)
+            )
+            product = result.scalars().one()
+        except Exception:
+            await asyncio.gather(*(remove_file_if_exists(path) for path in uploaded_paths))
+            raise
+
+    if product is None:
+        # Nothing to write; return the row as it stands
+        result = await db.execute(_product_by_id_stmt(current.product_id))
+        product = result.scalars().one()
+
+    return product
+
+
 @router.put("/id/{product_id}", response_model=ProductResponse, status_code=200)
 async def update_product(
     product_id: str,
@@ -1054,126 +1363,50 @@ async def update_product(
     files: List[UploadFile] = File(default=None),
     tags_and_relationships: Optional[str] = Form(default=None),
     status_flags: Optional[str] = Form(default=None),
+    data: Optional[str] = Form(default=None, description="All JSON sections in one object, e.g. {\"pricing\": {...}}"),
     db: AsyncSession = Depends(get_db)
 ):
-    result = await db.execute(select(Product).filter(Product.product_id == product_id))
-    product = result.scalars().first()
+    # Only what the update needs: the id, the slug to invalidate and the
+    # current name for image paths
+    result = await db.execute(
+        select(
+            Product.product_id,
+            Product.slug,
+            Product.identification["product_name"].astext.label("product_name"),
+        ).where(Product.product_id == product_id)
+    )
+    current = result.first()
 
-    if not product:
+    if not current:
         return APIResponse.response(
             StatusCode.NOT_FOUND,
             f"Product with ID {product_id} not found",
             log_error=True,
         )
 
-    if cat_id:
-        result = await db.execute(select(Category).filter(Category.category_id == cat_id))
-        if not result.scalars().first():
-            return APIResponse.response(StatusCode.NOT_FOUND, "Category not found", log_error=True)
-        product.category_id = cat_id
-
-    if subcat_id:
-        result = await db.execute(select(SubCategory).filter(SubCategory.subcategory_id == subcat_id))
-        if not result.scalars().first():
-            return APIResponse.response(StatusCode.NOT_FOUND, "Subcategory not found", log_error=True)
-        product.subcategory_id = subcat_id
-
     try:
-        identification_data = safe_json_parse(identification)
-        if identification_data:
-            product.identification = {**product.identification, **identification_data}
-
-        descriptions_data = safe_json_parse(descriptions)
-        if descriptions_data:
-            product.descriptions = {**(product.descriptions or {}), **descriptions_data}
-
-        pricing_data = safe_json_parse(pricing)
-        if pricing_data:
-            product.pricing = {**(product.pricing or {}), **pricing_data}
-
-        inventory_data = safe_json_parse(inventory)
-        if inventory_data:
-            product.inventory = {**(product.inventory or {}), **inventory_data}
-
-        physical_attributes_data = safe_json_parse(physical_attributes)
-        if physical_attributes_data:
-            product.physical_attributes = {**(product.physical_attributes or {}), **physical_attributes_data}
-
-        tags_and_relationships_data = safe_json_parse(tags_and_relationships)
-        if tags_and_relationships_data:
-            product.tags_and_relationships = {**(product.tags_and_relationships or {}), **tags_and_relationships_data}
-
-        status_flags_data = safe_json_parse(status_flags)
-        if status_flags_data:
-            product.status_flags = {**product.status_flags, **status_flags_data}
-    except json.JSONDecodeError as e:
+        patch = _collect_product_patch(data, {
+            "identification": identification,
+            "descriptions": descriptions,
+            "pricing": pricing,
+            "inventory": inventory,
+            "physical_attributes": physical_attributes,
+            "tags_and_relationships": tags_and_relationships,
+            "status_flags": status_flags,
+        })
+    except orjson.JSONDecodeError as e:
         return APIResponse.response(StatusCode.BAD_REQUEST, f"Invalid JSON data: {str(e)}", log_error=True)
 
-    # Update slug if product name was changed
-    if identification_data and "product_name" in identification_data:
-        new_product_name = identification_data["product_name"].strip()
-        if new_product_name:
-            new_slug = await generate_unique_slug(new_product_name, db, product_id)
-            product.slug = new_slug
-
-    if files:
-        try:
-            image_urls = []
-            product_name = product.identification.get("product_name", "").replace(" ", "_").lower()
-            cleaned_product_id = product_id.replace(" ", "_").lower()
-
-            for file in files:
-                # Read file content as bytes
-                file_content = await file.read()
-                timestamp = datetime.utcnow().strftime("%Y%m%d%H%M%S")
-                new_filename = f"{timestamp}_{file.filename}"
-                file_path = f"products/{product_name}/{cleaned_product_id}/{new_filename}"
-                
-                # Upload file to S3 and get the URL
-                image_url = await upload_file_to_s3(
-                    file_content=file_content,
-                    file_path=file_path,
-                    file_type=file.content_type
-                )
-                image_urls.append(image_url)
-
-            product.images = {"urls": image_urls}
-        except Exception as e:
-            return APIResponse.response(StatusCode.SERVER_ERROR, f"Failed to upload images: {str(e)}", log_error=True)
-
-    await db.commit()
-    await db.refresh(product)
-
-    # Fetch category and subcategory names
-    category_name = None
-    subcategory_name = None
-
-    if product.category_id:
-        result = await db.execute(
-            select(Category.category_name).filter(Category.category_id == product.category_id)
-        )
-        category_name = result.scalar()
-
-    if product.subcategory_id:
-        result = await db.execute(
-            select(SubCategory.subcategory_name).filter(SubCategory.subcategory_id == product.subcategory_id)
-        )
-        subcategory_name = result.scalar()
-    
-    # Fetch store_name from business profile
-    store_name = None
-    vendor_result = await db.execute(
-        select(VendorLogin)
-        .options(selectinload(VendorLogin.business_profile))
-        .filter(VendorLogin.user_id == product.vendor_id)
+    # RETURNING already reflects the names filled in by the product trigger
+    product = await _apply_product_update(
+        db, current, product_id.replace(" ", "_").lower(), cat_id, subcat_id, patch, files
     )
-    vendor = vendor_result.scalars().first()
-    if vendor and vendor.business_profile:
-        store_name = vendor.business_profile.store_name
+    await db.commit()
+    _invalidate_product_cache(product.product_id, current.slug, product.slug)
 
     return ProductResponse(
         product_id=product.product_id,
-        store_name=store_name,
+        store_name=product.store_name,
         slug=product.slug,
         identification=product.identification,
         descriptions=product.descriptions,
@@ -1185,9 +1418,9 @@ async def update_product(
         status_flags=product.status_flags,
         timestamp=product.timestamp,
         category_id=product.category_id,
-        category_name=category_name,
+        category_name=product.category_name,
         subcategory_id=product.subcategory_id,
-        subcategory_name=subcategory_name
+        subcategory_name=product.subcategory_name
     )
 
 
@@ -1204,126 +1437,50 @@ async def update_product_by_slug(
     files: List[UploadFile] = File(default=None),
     tags_and_relationships: Optional[str] = Form(default=None),
     status_flags: Optional[str] = Form(default=None),
+    data: Optional[str] = Form(default=None, description="All JSON sections in one object, e.g. {\"pricing\": {...}}"),
     db: AsyncSession = Depends(get_db)
 ):
-    result = await db.execute(select(Product).filter(Product.slug == slug))
-    product = result.scalars().first()
+    # Only what the update needs: the id, the slug to invalidate and the
+    # current name for image paths
+    result = await db.execute(
+        select(
+            Product.product_id,
+            Product.slug,
+            Product.identification["product_name"].astext.label("product_name"),
+        ).where(Product.slug == slug)
+    )
+    current = result.first()
 
-    if not product:
+    if not current:
         return APIResponse.response(
             StatusCode.NOT_FOUND,
             f"Product with slug '{slug}' not found",
             log_error=True,
         )
 
-    if cat_id:
-        result = await db.execute(select(Category).filter(Category.category_id == cat_id))
-        if not result.scalars().first():
-            return APIResponse.response(StatusCode.NOT_FOUND, "Category not found", log_error=True)
-        product.category_id = cat_id
-
-    if subcat_id:
-        result = await db.execute(select(SubCategory).filter(SubCategory.subcategory_id == subcat_id))
-        if not result.scalars().first():
-            return APIResponse.response(StatusCode.NOT_FOUND, "Subcategory not found", log_error=True)
-        product.subcategory_id = subcat_id
-
     try:
-        identification_data = safe_json_parse(identification)
-        if identification_data:
-            product.identification = {**product.identification, **identification_data}
-
-        descriptions_data = safe_json_parse(descriptions)
-        if descriptions_data:
-            product.descriptions = {**(product.descriptions or {}), **descriptions_data}
-
-        pricing_data = safe_json_parse(pricing)
-        if pricing_data:
-            product.pricing = {**(product.pricing or {}), **pricing_data}
-
-        inventory_data = safe_json_parse(inventory)
-        if inventory_data:
-            product.inventory = {**(product.inventory or {}), **inventory_data}
-
-        physical_attributes_data = safe_json_parse(physical_attributes)
-        if physical_attributes_data:
-            product.physical_attributes = {**(product.physical_attributes or {}), **physical_attributes_data}
-
-        tags_and_relationships_data = safe_json_parse(tags_and_relationships)
-        if tags_and_relationships_data:
-            product.tags_and_relationships = {**(product.tags_and_relationships or {}), **tags_and_relationships_data}
-
-        status_flags_data = safe_json_parse(status_flags)
-        if status_flags_data:
-            product.status_flags = {**product.status_flags, **status_flags_data}
-    except json.JSONDecodeError as e:
+        patch = _collect_product_patch(data, {
+            "identification": identification,
+            "descriptions": descriptions,
+            "pricing": pricing,
+            "inventory": inventory,
+            "physical_attributes": physical_attributes,
+            "tags_and_relationships": tags_and_relationships,
+            "status_flags": status_flags,
+        })
+    except orjson.JSONDecodeError as e:
         return APIResponse.response(StatusCode.BAD_REQUEST, f"Invalid JSON data: {str(e)}", log_error=True)
 
-    # Update slug if product name was changed
-    if identification_data and "product_name" in identification_data:
-        new_product_name = identification_data["product_name"].strip()
-        if new_product_name:
-            new_slug = await generate_unique_slug(new_product_name, db, product.product_id)
-            product.slug = new_slug
-
-    if files:
-        try:
-            image_urls = []
-            product_name = product.identification.get("product_name", "").replace(" ", "_").lower()
-            cleaned_slug = slug.replace(" ", "_").lower()
-
-            for file in files:
-                # Read file content as bytes
-                file_content = await file.read()
-                timestamp = datetime.utcnow().strftime("%Y%m%d%H%M%S")
-                new_filename = f"{timestamp}_{file.filename}"
-                file_path = f"products/{product_name}/{cleaned_slug}/{new_filename}"
-                
-                # Upload file to S3 and get the URL
-                image_url = await upload_file_to_s3(
-                    file_content=file_content,
-                    file_path=file_path,
-                    file_type=file.content_type
-                )
-                image_urls.append(image_url)
-
-            product.images = {"urls": image_urls}
-        except Exception as e:
-            return APIResponse.response(StatusCode.SERVER_ERROR, f"Failed to upload images: {str(e)}", log_error=True)
-
-    await db.commit()
-    await db.refresh(product)
-
-    # Fetch category and subcategory names
-    category_name = None
-    subcategory_name = None
-
-    if product.category_id:
-        result = await db.execute(
-            select(Category.category_name).filter(Category.category_id == product.category_id)
-        )
-        category_name = result.scalar()
-
-    if product.subcategory_id:
-        result = await db.execute(
-            select(SubCategory.subcategory_name).filter(SubCategory.subcategory_id == product.subcategory_id)
-        )
-        subcategory_name = result.scalar()
-    
-    # Fetch store_name from business profile
-    store_name = None
-    vendor_result = await db.execute(
-        select(VendorLogin)
-        .options(selectinload(VendorLogin.business_profile))
-        .filter(VendorLogin.user_id == product.vendor_id)
+    # RETURNING already reflects the names filled in by the product trigger
+    product = await _apply_product_update(
+        db, current, slug.replace(" ", "_").lower(), cat_id, subcat_id, patch, files
     )
-    vendor = vendor_result.scalars().first()
-    if vendor and vendor.business_profile:
-        store_name = vendor.business_profile.store_name
+    await db.commit()
+    _invalidate_product_cache(product.product_id, current.slug, product.slug)
 
     return ProductResponse(
         product_id=product.product_id,
-        store_name=store_name,
+        store_name=product.store_name,
         slug=product.slug,
         identification=product.identification,
         descriptions=product.descriptions,
@@ -1335,26 +1492,47 @@ async def update_product_by_slug(
         status_flags=product.status_flags,
         timestamp=product.timestamp,
         category_id=product.category_id,
-        category_name=category_name,
+        category_name=product.category_name,
         subcategory_id=product.subcategory_id,
-        subcategory_name=subcategory_name
+        subcategory_name=product.subcategory_name
+    )
+
+
+async def _set_product_status(db: AsyncSession, condition, deleted: bool):
+    """
+    Set status_flags.product_status in a single UPDATE ... RETURNING.
+    Returns the (product_id, slug) row, or None if nothing matched.
+    """
+    result = await db.execute(
+        update(Product)
+        .where(condition)
+        .values(
+            status_flags=func.jsonb_set(
+                func.coalesce(Product.status_flags, text("'{}'::jsonb")),
+                text("'{product_status}'"),
+                text("'true'::jsonb" if deleted else "'false'::jsonb"),
+            )
+        )
+        .returning(Product.product_id, Product.slug)
+        .execution_options(synchronize_session=False)
     )
+    row = result.first()
+    await db.commit()
+    return row
 
 
 @router.put("/slug/delete/{slug}", response_model=Dict)
 async def soft_delete_product_by_slug(slug: str, db: AsyncSession = Depends(get_db)):
-    result = await db.execute(select(Product).filter(Product.slug == slug))
-    product = result.scalars().first()
+    row = await _set_product_status(db, Product.slug == slug, deleted=True)
 
-    if not product:
+    if not row:
         return APIResponse.response(
             StatusCode.NOT_FOUND,
             f"Product with slug '{slug}' not found",
             log_error=True
         )
 
-    product.status_flags["product_status"] = True
-    await db.commit()
+    _invalidate_product_cache(row.product_id, row.slug)
 
     return {"message": f"Product with slug '{slug}' soft deleted successfully"}
 
@@ -1362,54 +1540,48 @@ async def soft_delete_product_by_slug(slug: str, db: AsyncSession = Depends(get_
 
 @router.put("/delete/{product_id}", response_model=Dict)
 async def soft_delete_product(product_id: str, db: AsyncSession = Depends(get_db)):
-    result = await db.execute(select(Product).filter(Product.product_id == product_id))
-    product = result.scalars().first()
+    row = await _set_product_status(db, Product.product_id == product_id, deleted=True)
 
-    if not product:
+    if not row:
         return APIResponse.response(
             StatusCode.NOT_FOUND,
             f"Product with ID {product_id} not found",
             log_error=True
         )
 
-    product.status_flags["product_status"] = True
-    await db.commit()
+    _invalidate_product_cache(row.product_id, row.slug)
 
     return {"message": f"Product {product_id} soft deleted successfully"}
 
 
 @router.put("/restore/{product_id}", response_model=Dict)
 async def restore_product(product_id: str, db: AsyncSession = Depends(get_db)):
-    result = await db.execute(select(Product).filter(Product.product_id == product_id))
-    product = result.scalars().first()
+    row = await _set_product_status(db, Product.product_id == product_id, deleted=False)
 
-    if not product:
+    if not row:
         return APIResponse.response(
             StatusCode.NOT_FOUND,
             f"Product with ID {product_id} not found",
             log_error=True
         )
 
-    product.status_flags["product_status"] = False
-    await db.commit()
+    _invalidate_product_cache(row.product_id, row.slug)
 
     return {"message": f"Product {product_id} restored successfully"}
 
 
 @router.put("/slug/restore/{slug}", response_model=Dict)
-async def restore_product(slug: str, db: AsyncSession = Depends(get_db)):
-    result = await db.execute(select(Product).filter(Product.slug == slug))
-    product = result.scalars().first()
+async def restore_product_by_slug(slug: str, db: AsyncSession = Depends(get_db)):
+    row = await _set_product_status(db, Product.slug == slug, deleted=False)
 
-    if not product:
+    if not row:
         return APIResponse.response(
             StatusCode.NOT_FOUND,
             f"Product with slug {slug} not found",
             log_error=True
         )
 
-    product.status_flags["product_status"] = False
-    await db.commit()
+    _invalidate_product_cache(row.product_id, row.slug)
 
     return {"message": f"Product {slug} restored successfully"}
 
@@ -1417,14 +1589,17 @@ async def restore_product(slug: str, db: AsyncSession = Depends(get_db)):
 @router.get("/category/{slug}", response_model=ProductByCategoryListResponse, status_code=200)
 async def get_products_by_category_or_subcategory_slug(
     slug: str,
+    limit: int = Query(PRODUCT_PAGE_SIZE, ge=1, le=PRODUCT_PAGE_SIZE_MAX),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
     db: AsyncSession = Depends(get_db)
 ):
     try:
         # First, try to find a category by slug
         category_result = await db.execute(
-            select(Category).filter(Category.category_slug == slug)
+            select(Category.category_id, Category.category_name)
+            .filter(Category.category_slug == slug)
         )
-        category = category_result.scalars().first()
+        category = category_result.first()
         
         subcategory = None
         slug_type = None
@@ -1436,23 +1611,26 @@ async def get_products_by_category_or_subcategory_slug(
             slug_type = "category"
             category_name = category.category_name
             
-            # Get all products for this category with business profile
+            # Get all products for this category
             products_query = (
-                select(Product, VendorLogin, BusinessProfile)
-                .join(VendorLogin, Product.vendor_id == VendorLogin.user_id)
-                .join(BusinessProfile, VendorLogin.business_profile_id == BusinessProfile.profile_ref_id)
-                .filter(Product.category_id == category.category_id)
+                select(*CATEGORY_LISTING_COLUMNS)
+                .filter(_products.c.category_id == category.category_id)
             )
-            count_query = select(func.count(Product.product_id)).filter(Product.category_id == category.category_id)
+            count_query = select(_products.c.product_id).filter(_products.c.category_id == category.category_id)
             
         else:
             # Try to find a subcategory by slug
+            # The parent category name comes from the same joined row
             subcategory_result = await db.execute(
-                select(SubCategory)
+                select(
+                    SubCategory.subcategory_id,
+                    SubCategory.subcategory_name,
+                    Category.category_name,
+                )
+                .join(Category, SubCategory.category_id == Category.category_id)
                 .filter(SubCategory.subcategory_slug == slug)
-                .options(selectinload(SubCategory.category))
             )
-            subcategory = subcategory_result.scalars().first()
+            subcategory = subcategory_result.first()
             
             if not subcategory:
                 return APIResponse.response(
@@ -1463,82 +1641,49 @@ async def get_products_by_category_or_subcategory_slug(
             
             # Found a subcategory
             slug_type = "subcategory"
-            category_name = subcategory.category.category_name
+            category_name = subcategory.category_name
             subcategory_name = subcategory.subcategory_name
             
-            # Get all products for this subcategory with business profile
+            # Get all products for this subcategory
             products_query = (
-                select(Product, VendorLogin, BusinessProfile)
-                .join(VendorLogin, Product.vendor_id == VendorLogin.user_id)
-                .join(BusinessProfile, VendorLogin.business_profile_id == BusinessProfile.profile_ref_id)
-                .filter(Product.subcategory_id == subcategory.subcategory_id)
+                select(*CATEGORY_LISTING_COLUMNS)
+                .filter(_products.c.subcategory_id == subcategory.subcategory_id)
             )
-            count_query = select(func.count(Product.product_id)).filter(Product.subcategory_id == subcategory.subcategory_id)
-
-        # Add options to load relationships
-        products_query = products_query.options(
-            selectinload(Product.category),
-            selectinload(Product.subcategory)
-        )
+            count_query = select(_products.c.product_id).filter(_products.c.subcategory_id == subcategory.subcategory_id)
 
         # Execute queries
-        products_result = await db.execute(products_query)
-        products_data = products_result.all()
+        products_result = await db.execute(
+            _keyset_page(products_query, cursor, limit, key=_products.c.product_id)
+        )
+        products_data, next_cursor = _split_page(products_result.all(), limit)
 
-        count_result = await db.execute(count_query)
-        total_count = count_result.scalar()
+        total_count = await _estimated_count(db, count_query)
 
-        # Convert ORM objects to simplified response format
+        # Rows already hold the flattened fields; only the thumbnail needs
+        # resolving to a full URL
+        thumbnails = get_media_urls(row.thumbnail_path for row in products_data)
+        # Rows come from the database, so items skip validation
         product_responses = []
-        for product, vendor_login, business_profile in products_data:
-            # Get thumbnail image (first image if available)
-            thumbnail_image = None
-            if product.images and "urls" in product.images and product.images["urls"]:
-                thumbnail_image = get_media_url(product.images["urls"][0])
-
-            # Extract data from JSON fields
-            product_name = product.identification.get("product_name", "") if product.identification else ""
-            product_sku = product.identification.get("product_sku", "") if product.identification else None
-            short_description = product.descriptions.get("short_description", "") if product.descriptions else None
-            selling_price = product.pricing.get("selling_price", "") if product.pricing else None
-            actual_price = product.pricing.get("actual_price", "") if product.pricing else None
-
-            stock = product.inventory.get("quantity", "") if product.inventory else None
-            stock_alert_status = product.inventory.get("stock_alert_status", "") if product.inventory else None
-            
-            # Extract status flags
-            featured_product = product.status_flags.get("featured_product", False) if product.status_flags else False
-            published_product = product.status_flags.get("published_product", True) if product.status_flags else True
-            product_status = product.status_flags.get("product_status", False) if product.status_flags else False
-
-            product_response = ProductByCategoryResponse(
-                product_id=product.product_id,
-                product_name=product_name,
-                product_sku=product_sku,
-                stock = stock,
-                stock_alert_status= stock_alert_status,
-                slug=product.slug,
-                short_description=short_description,
-                selling_price=selling_price,
-                actual_price=actual_price,
-                thumbnail_image=thumbnail_image,
-                featured_product=featured_product,
-                published_product=published_product,
-                product_status=product_status,
-                timestamp=product.timestamp,
-                category_name=category_name,
-                subcategory_name=product.subcategory.subcategory_name if product.subcategory else None,
-                store_name=business_profile.store_name if business_profile else None,
+        for row, thumbnail_image in zip(products_data, thumbnails):
+            fields = row._asdict()
+            del fields["thumbnail_path"]
+            product_responses.append(
+                ProductByCategoryResponse.model_construct(
+                    **fields,
+                    thumbnail_image=thumbnail_image,
+                    category_name=category_name,
+                )
             )
-            product_responses.append(product_response)
 
-        return ProductByCategoryListResponse(
+        return constructed_response(
+            ProductByCategoryListResponse,
             products=product_responses,
             total_count=total_count,
             slug=slug,
             slug_type=slug_type,
             category_name=category_name,
-            subcategory_name=subcategory_name
+            subcategory_name=subcategory_name,
+            next_cursor=next_cursor
         )
 
     except Exception as e:
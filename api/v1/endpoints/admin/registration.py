@@ -1,12 +1,15 @@
+import asyncio
+from typing import Optional
+
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
-from sqlalchemy import select
+from sqlalchemy import exists, literal, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.responses import JSONResponse
-from passlib.context import CryptContext
 from utils.email_utils import send_admin_welcome_email
 from utils.validations import generate_random_password
 from core.api_response import api_response
-from db.models.superadmin import AdminUser, Config, Role
+from db.models.superadmin import AdminUser
 from db.sessions.database import get_db
 from schemas.admin_user import (
     AdminCreateRequest,
@@ -14,26 +17,61 @@ from schemas.admin_user import (
     AdminRegisterRequest,
     AdminRegisterResponse,
 )
-from services.admin_user import (
-    get_config_or_404,
-    validate_role,
-    validate_superadmin_uniqueness,
-    validate_unique_user,
+from services.admin_user import SUPERADMIN_ROLE_NAMES, get_cached_config, get_cached_role
+from services.admin_password_service import (
+    generate_admin_password,
+    hash_admin_password,
+    send_admin_credentials_email,
 )
-from services.admin_password_service import generate_and_send_admin_credentials
 from utils.exception_handlers import exception_handler
 from utils.file_uploads import get_media_url
 from utils.id_generators import encrypt_data, generate_lower_uppercase, hash_data, decrypt_data
 
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+router = APIRouter()
 
 
-router = APIRouter()
+# Fresh IDs tried before giving up on a user_id collision
+USER_ID_ATTEMPTS = 5
+
+
+def _scalar(column, *criteria):
+    """Scalar subquery for one column, so several lookups share a statement"""
+    return select(column).where(*criteria).limit(1).scalar_subquery()
+
+
+async def _insert_admin_user(db: AsyncSession, **values) -> Optional[str]:
+    """
+    Insert an admin user and return its generated user_id, or None if the
+    email is already registered.
+
+    user_id is 6 random letters to fit the existing column, so a clash with
+    an existing ID is retried with a new one instead of failing the request.
+    """
+    for _ in range(USER_ID_ATTEMPTS):
+        user_id = generate_lower_uppercase(length=6)
+        result = await db.execute(
+            pg_insert(AdminUser)
+            .values(user_id=user_id, **values)
+            .on_conflict_do_nothing()
+            .returning(AdminUser.user_id)
+        )
+        if result.scalar_one_or_none() is not None:
+            return user_id
+
+        # Only a conflict gets here; find out whether it was the email
+        email_taken = await db.scalar(
+            select(literal(1)).where(AdminUser.email_hash == values["email_hash"]).limit(1)
+        )
+        if email_taken:
+            return None
+
+    raise RuntimeError("Could not allocate a unique admin user ID")
 
 
 @router.post("/admin/create", response_model=AdminCreateResponse, status_code=status.HTTP_201_CREATED)
 async def create_admin_user(
+    background_tasks: BackgroundTasks,
     admin_data: AdminCreateRequest,
     db: AsyncSession = Depends(get_db),
 ):
@@ -41,97 +79,86 @@ async def create_admin_user(
         # Convert email to lowercase for case-insensitive storage and comparison
         normalized_email = admin_data.email.strip().lower()
         
-        # Check if user with this email already exists
         email_hash = hash_data(normalized_email)
-        existing_user_stmt = select(AdminUser).where(AdminUser.email_hash == email_hash)
-        existing_user_result = await db.execute(existing_user_stmt)
-        existing_user = existing_user_result.scalar_one_or_none()
-        
-        if existing_user:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail="User with this email already exists"
-            )
-        
-        # Check if username already exists (need to check encrypted usernames)
+
         # Capitalize first letter of username
         capitalized_username = admin_data.username.strip().capitalize()
         encrypted_username = encrypt_data(capitalized_username)
-        existing_username_stmt = select(AdminUser).where(AdminUser.username == encrypted_username)
-        existing_username_result = await db.execute(existing_username_stmt)
-        existing_username_user = existing_username_result.scalar_one_or_none()
-        
-        if existing_username_user:
+
+        superadmin_role = await get_cached_role(db, role_name="SUPERADMIN")
+        superadmin_role_id = superadmin_role.role_id if superadmin_role else None
+
+        # Username and superadmin uniqueness are checked in a single round
+        # trip. Email uniqueness is enforced by the insert itself.
+        checks_result = await db.execute(
+            select(
+                exists().where(AdminUser.username == encrypted_username).label("username_taken"),
+                exists().where(AdminUser.role_id == superadmin_role_id).label("superadmin_exists"),
+            )
+        )
+        checks = checks_result.one()
+
+        if checks.username_taken:
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
                 detail="User with this username already exists"
             )
-        
-        # Get SUPERADMIN role from roles table
-        role_stmt = select(Role).where(Role.role_name == "SUPERADMIN")
-        role_result = await db.execute(role_stmt)
-        superadmin_role = role_result.scalar_one_or_none()
-        
+
         if not superadmin_role:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="SUPERADMIN role not found in database"
             )
-        
-        # Check superadmin uniqueness - only allow one superadmin
-        superadmin_result = await validate_superadmin_uniqueness(db, superadmin_role)
-        if superadmin_result is not None:
+
+        # Only allow one superadmin
+        if checks.superadmin_exists:
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
                 detail="Super Admin already exists. Only one Super Admin is allowed."
             )
         
-        # Generate unique user ID
-        user_id = generate_lower_uppercase(length=6)
-        
         # Encrypt sensitive data (use normalized lowercase email)
         encrypted_email = encrypt_data(normalized_email)
         
-        # Hash password
-        hashed_password = pwd_context.hash(admin_data.password)
+        # Hash password; bcrypt releases the GIL, so a worker thread keeps
+        # the event loop free while it runs
+        hashed_password = await asyncio.to_thread(hash_admin_password, admin_data.password)
         
-        # Create new admin user
-        new_admin = AdminUser(
-            user_id=user_id,
-            role_id=superadmin_role.role_id,
+        # Create new admin user; a concurrent or existing signup with the
+        # same email makes the insert return nothing instead of failing
+        user_id = await _insert_admin_user(
+            db,
+            role_id=superadmin_role_id,
             username=encrypted_username,
             email=encrypted_email,
             email_hash=email_hash,
             password=hashed_password,
             login_status=0,  # Default login status is 0 (no email verification required)
-            is_active=False, 
+            is_active=False,
         )
-        
-        # Add to database
-        db.add(new_admin)
-        await db.commit()
-        await db.refresh(new_admin)
-        
-        # Send welcome email
-        email_sent = False
-        
-        try:
-            email_sent = send_admin_welcome_email(
-                email=normalized_email,  # Use normalized email for sending
-                username=capitalized_username,
-                password=admin_data.password,  # Send the plain password in email
+        if user_id is None:
+            await db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="User with this email already exists"
             )
-        except Exception as e:
-            # Log the error but don't fail the user creation
-            print(f"Failed to send welcome email: {e}")
+        await db.commit()
         
+        # Send welcome email after the response; SMTP stays off the request path
+        background_tasks.add_task(
+            send_admin_welcome_email,
+            email=normalized_email,  # Use normalized email for sending
+            username=capitalized_username,
+            password=admin_data.password,  # Send the plain password in email
+        )
+
         return AdminCreateResponse(
             user_id=user_id,
             username=capitalized_username,
             email=normalized_email,  # Return normalized email
-            role_id=superadmin_role.role_id,
-            message="Admin user created successfully" + (" and welcome email sent" if email_sent else " but email sending failed"),
-            email_sent=email_sent
+            role_id=superadmin_role_id,
+            message="Admin user created successfully and welcome email queued",
+            email_sent=True,  # Queued; delivery failures are logged by the sender
         )
         
     except HTTPException:
@@ -160,47 +187,43 @@ async def register_user(
     
     # Capitalize first letter of username
     capitalized_username = user_data.username.strip().capitalize()
-    encrypted_username = encrypt_data(capitalized_username)
-    encrypted_email = encrypt_data(normalized_email)
-
-    # Check if encrypted data length is within database limits
-    if len(encrypted_username) > 500:
-        return api_response(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            message="Username is too long for encryption storage.",
-            log_error=True,
-        )
-    
-    if len(encrypted_email) > 500:
-        return api_response(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            message="Email is too long for encryption storage.",
-            log_error=True,
-        )
 
+    # Lookups only need the hash; encryption waits until the user is created
     email_hash = hash_data(normalized_email)
 
-    # Check if user already exists
-    existing_user_stmt = select(AdminUser).where(AdminUser.email_hash == email_hash)
-    existing_user_result = await db.execute(existing_user_stmt)
-    existing_user = existing_user_result.scalar_one_or_none()
-    
-    if existing_user:
+    # Role and configuration come from the per-process cache; the existing
+    # user and superadmin uniqueness share a single round trip
+    role = await get_cached_role(db, role_id=user_data.role_id)
+    config = await get_cached_config(db)
+
+    checks_result = await db.execute(
+        select(
+            _scalar(AdminUser.user_id, AdminUser.email_hash == email_hash).label("existing_user_id"),
+            _scalar(AdminUser.username, AdminUser.email_hash == email_hash).label("existing_username"),
+            _scalar(AdminUser.is_active, AdminUser.email_hash == email_hash).label("existing_is_active"),
+            exists().where(AdminUser.role_id == user_data.role_id).label("role_in_use"),
+        )
+    )
+    checks = checks_result.one()
+
+    if checks.existing_user_id:
         # If user exists and is inactive (is_active=True means inactive), reactivate them
-        if existing_user.is_active:  # True means inactive
+        if checks.existing_is_active:  # True means inactive
             # Simply reactivate the user
-            existing_user.is_active = False  # False means active
-            
+            await db.execute(
+                update(AdminUser)
+                .where(AdminUser.user_id == checks.existing_user_id)
+                .values(is_active=False)  # False means active
+            )
             await db.commit()
-            await db.refresh(existing_user)
-            
+
             return api_response(
                 status_code=status.HTTP_200_OK,
                 message="User reactivated successfully.",
                 data=AdminRegisterResponse(
-                    user_id=existing_user.user_id,
+                    user_id=checks.existing_user_id,
                     email=normalized_email,
-                    username=decrypt_data(existing_user.username),
+                    username=decrypt_data(checks.existing_username),
                     password="",  # Don't expose existing password
                 ),
             )
@@ -213,46 +236,55 @@ async def register_user(
             )
 
     # Validate role
-    role_result = await validate_role(db, user_data.role_id)
-    if not isinstance(role_result, Role):
-        return role_result
-
-    role = role_result
+    if role is None:
+        return api_response(
+            status_code=status.HTTP_404_NOT_FOUND,
+            message="Role not found.",
+            log_error=True,
+        )
+    if role.role_status:
+        return api_response(
+            status_code=status.HTTP_403_FORBIDDEN,
+            message="Role is inactive.",
+            log_error=True,
+        )
 
     # Check superadmin uniqueness
-    superadmin_result = await validate_superadmin_uniqueness(db, role)
-    if superadmin_result is not None:
-        return superadmin_result
+    if role.role_name.lower() in SUPERADMIN_ROLE_NAMES and checks.role_in_use:
+        return api_response(
+            status_code=status.HTTP_409_CONFLICT,
+            message=(
+                "Super Admin already exists. Only one Super Admin is allowed. "
+                "Please register with a different role."
+            ),
+            log_error=True,
+        )
 
     # Get system configuration
-    config_result = await get_config_or_404(db)
-    if not isinstance(config_result, Config):
-        return config_result
-
-    config = config_result
+    if config is None:
+        return api_response(
+            status_code=status.HTTP_404_NOT_FOUND,
+            message="Configuration not found.",
+            log_error=True,
+        )
 
-    # Generate unique user ID and random password for new admin
-    user_id = generate_lower_uppercase(length=6)
     logo_url = get_media_url(config.logo_url or "") or ""
     
-    # Generate random password and send credentials via email
-    plain_password, hashed_password, email_sent = generate_and_send_admin_credentials(
-        email=normalized_email,  # Use normalized email
-        username=capitalized_username,
-        logo_url=logo_url
+    # Generate random password. Hashing and encryption happen only on the
+    # insert path, after every check has passed, and run together on worker
+    # threads so none of them blocks the event loop. The request schema caps
+    # both encrypted fields so the tokens fit their columns.
+    plain_password = generate_admin_password(6)
+    hashed_password, encrypted_username, encrypted_email = await asyncio.gather(
+        asyncio.to_thread(hash_admin_password, plain_password),
+        asyncio.to_thread(encrypt_data, capitalized_username),
+        asyncio.to_thread(encrypt_data, normalized_email),
     )
-    
-    # Check if password generation was successful
-    if not hashed_password:
-        return api_response(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            message="Failed to generate admin password. Please try again.",
-            log_error=True,
-        )
 
-    # Create new user
-    new_user = AdminUser(
-        user_id=user_id,
+    # Create new user; the email check above can race with another signup,
+    # so the insert also skips an existing email_hash rather than failing
+    user_id = await _insert_admin_user(
+        db,
         role_id=user_data.role_id,
         username=encrypted_username,
         email=encrypted_email,
@@ -261,16 +293,25 @@ async def register_user(
         login_status=-1,  # Default to -1 (not logged in)
         days_180_flag=config.global_180_day_flag,
     )
-
-    # Add to database
-    db.add(new_user)
+    if user_id is None:
+        await db.rollback()
+        return api_response(
+            status_code=status.HTTP_409_CONFLICT,
+            message="User with the given email already exists and is active.",
+            log_error=True,
+        )
     await db.commit()
-    await db.refresh(new_user)
 
-    # Return success response with email status
-    email_status = "Credentials email sent successfully." if email_sent else "User created but email sending failed."
-    message = f"User registered successfully. {email_status}"
-    
+    # Send credentials after the response, and only once the user exists
+    background_tasks.add_task(
+        send_admin_credentials_email,
+        email=normalized_email,  # Use normalized email
+        username=capitalized_username,
+        password=plain_password,
+        logo_url=logo_url,
+    )
+    message = "User registered successfully. Credentials email queued."
+
     return api_response(
         status_code=status.HTTP_201_CREATED,
         message=message,
@@ -10,6 +10,7 @@ from core.status_codes import APIResponse, StatusCode
 from core.api_response import api_response
 from db.models.superadmin import Role
 from db.sessions.database import get_db
+from services.admin_user import role_cache
 from schemas.role_perm_schemas import CreateRole, RoleDetails, RoleUpdate
 from utils.exception_handlers import exception_handler
 from utils.id_generators import generate_digits_lowercase
@@ -42,6 +43,7 @@ async def create_role(
             existing_role.role_status = False
             existing_role.role_tstamp = datetime.now(timezone.utc)
             await db.commit()
+            role_cache.clear()
             await db.refresh(existing_role)
             return api_response(
                 status_code=status.HTTP_200_OK,
@@ -65,6 +67,7 @@ async def create_role(
     )
     db.add(new_role)
     await db.commit()
+    role_cache.clear()
     await db.refresh(new_role)
 
     return api_response(
@@ -180,6 +183,8 @@ async def update_role(
         role.role_name = update_data.role_name
 
     await db.commit()
+
+    role_cache.clear()
     await db.refresh(role)
 
     return api_response(
@@ -210,6 +215,7 @@ async def update_role_status(
 
     role.role_status = role_status
     await db.commit()
+    role_cache.clear()
     await db.refresh(role)
 
     return api_response(
@@ -249,6 +255,7 @@ async def delete_role(
         # Proceed with hard delete
         await db.delete(role)
         await db.commit()
+        role_cache.clear()
         return api_response(
             status_code=status.HTTP_200_OK,
             message="Role permanently deleted (hard delete).",
@@ -257,6 +264,7 @@ async def delete_role(
     if hard_delete:
         await db.delete(role)
         await db.commit()
+        role_cache.clear()
         return api_response(
             status_code=status.HTTP_200_OK,
             message="Role permanently deleted (hard delete).",
@@ -264,6 +272,7 @@ async def delete_role(
     else:
         role.role_status = True  # Soft delete
         await db.commit()
+        role_cache.clear()
         return api_response(
             status_code=status.HTTP_200_OK,
             message="Role soft-deleted successfully.",
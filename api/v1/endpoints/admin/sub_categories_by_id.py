@@ -19,12 +19,14 @@ from core.config import settings
 from db.models.superadmin import SubCategory
 from db.sessions.database import get_db
 from services.category_service import (
+    category_cache,
     check_subcategory_conflicts,
     check_subcategory_vs_category_conflicts,
     validate_subcategory_fields,
     activate_subcategory,
     deactivate_subcategory,
 )
+from services.product_service import product_cache
 from utils.exception_handlers import exception_handler
 from utils.file_uploads import get_media_url, save_uploaded_file
 from utils.format_validators import is_valid_filename
@@ -232,6 +234,8 @@ async def update_subcategory(
 
     # === Commit changes to database ===
     await db.commit()
+    category_cache.clear()
+    product_cache.clear()
     await db.refresh(subcategory)
 
     return api_response(
@@ -262,6 +266,8 @@ async def soft_delete_subcategory(
     # Deactivate the subcategory
     await deactivate_subcategory(db, subcategory)
     await db.commit()
+    category_cache.clear()
+    product_cache.clear()
 
     return api_response(
         status.HTTP_200_OK, "Subcategory soft deleted successfully"
@@ -289,6 +295,8 @@ async def restore_subcategory(
     # Activate the subcategory (with parent category validation)
     await activate_subcategory(db, subcategory)
     await db.commit()
+    category_cache.clear()
+    product_cache.clear()
 
     return api_response(status.HTTP_200_OK, "Subcategory restored successfully")
 
@@ -308,5 +316,7 @@ async def hard_delete_subcategory(
 
     await db.delete(subcategory)
     await db.commit()
+    category_cache.clear()
+    product_cache.clear()
 
     return api_response(status.HTTP_200_OK, "Subcategory permanently deleted")
@@ -1,61 +1,170 @@
+import base64
+import binascii
 from datetime import datetime
+from typing import Optional
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import exists, lambda_stmt, literal, select, func, tuple_, update
 import math
 
-from db.models.superadmin import BusinessProfile, VendorLogin, Product, Category, SubCategory, Industries
+from core.api_response import constructed_response
+from core.logging_config import get_logger
+from db.models.superadmin import BusinessProfile, VendorLogin, Product, Category, Industries
 from db.sessions.database import get_db
-from schemas.vendor_management import RejectRequest, VendorActionRequest, VendorActionResponse, VendorStatusResponse
+from schemas.vendor_management import (
+    RejectRequest,
+    VendorActionRequest,
+    VendorActionResponse,
+    VendorBatchActionRequest,
+    VendorBatchActionResponse,
+    VendorStatusResponse,
+)
 from schemas.products import AllProductsListResponse, AllProductsResponse
-from utils.file_uploads import get_media_url
-from utils.id_generators import decrypt_data
-from utils.email_utils.vendor_emails import send_vendor_approval_email, send_vendor_rejection_email
+from services.product_service import product_count_cache
+from utils.file_uploads import get_media_urls
+from utils.id_generators import decrypt_cached
+from utils.email_utils.vendor_emails import (
+    send_vendor_approval_email,
+    send_vendor_approval_emails,
+    send_vendor_rejection_email,
+)
 
 
 router = APIRouter()
+logger = get_logger(__name__)
 
 
-@router.post("/vendor/approve", response_model=dict)
-async def approve_vendor(
-    user_id: str,
-    background_tasks: BackgroundTasks,
-    db: AsyncSession = Depends(get_db),
-):
-    # Fetch vendor
-    stmt = select(VendorLogin).where(VendorLogin.user_id == user_id)
-    result = await db.execute(stmt)
-    vendor = result.scalar_one_or_none()
+def _encode_product_cursor(product) -> str:
+    """Opaque cursor for the (timestamp, product_id) position of a product"""
+    raw = f"{product.timestamp.isoformat()}|{product.product_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_product_cursor(cursor: str):
+    """Inverse of _encode_product_cursor; a malformed cursor is a 400"""
+    try:
+        timestamp, product_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|", 1)
+        return datetime.fromisoformat(timestamp), product_id
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+# Per-vendor lookups are built through lambda_stmt so SQLAlchemy caches the
+# constructed statement and only rebinds user_id per call
+def _vendor_exists_stmt(user_id: str):
+    return lambda_stmt(
+        lambda: select(literal(1)).where(VendorLogin.user_id == user_id).limit(1)
+    )
 
-    if not vendor:
-        raise HTTPException(status_code=404, detail="Vendor not found")
 
-    # Fetch business profile
-    profile_stmt = select(BusinessProfile).where(
-        BusinessProfile.profile_ref_id == vendor.business_profile_id
+def _vendor_status_stmt(user_id: str):
+    return lambda_stmt(
+        lambda: select(
+            VendorLogin.user_id,
+            func.coalesce(BusinessProfile.store_name, VendorLogin.username).label("store_name"),
+            VendorLogin.email,
+            VendorLogin.is_active,
+            VendorLogin.is_verified,
+            VendorLogin.last_login,
+            VendorLogin.created_at,
+        )
+        .outerjoin(
+            BusinessProfile,
+            VendorLogin.business_profile_id == BusinessProfile.profile_ref_id,
+        )
+        .where(VendorLogin.user_id == user_id)
     )
-    profile_result = await db.execute(profile_stmt)
-    business_profile = profile_result.scalar_one_or_none()
 
-    if not business_profile:
+
+async def _update_vendor_and_profile(
+    db: AsyncSession, user_id: str, vendor_values: dict, profile_values: dict
+):
+    """
+    Apply a review decision to a vendor and its business profile.
+
+    Both tables are changed by one statement: the ven_login UPDATE runs in a
+    CTE and the business profile UPDATE joins to its RETURNING, so the
+    fields the notification email needs come back in a single round trip
+    without loading either row. The vendor is only changed when it has a
+    profile, so a 404 leaves nothing to roll back. Nothing is committed here.
+    """
+    vendor = (
+        update(VendorLogin)
+        .where(
+            VendorLogin.user_id == user_id,
+            exists().where(BusinessProfile.profile_ref_id == VendorLogin.business_profile_id),
+        )
+        .values(**vendor_values)
+        .returning(VendorLogin.email, VendorLogin.business_profile_id)
+        .cte("vendor")
+    )
+    result = await db.execute(
+        update(BusinessProfile)
+        .where(BusinessProfile.profile_ref_id == vendor.c.business_profile_id)
+        .values(**profile_values)
+        .returning(vendor.c.email, BusinessProfile.store_name, BusinessProfile.ref_number)
+    )
+    review = result.one_or_none()
+
+    if review is None:
+        # Nothing matched; tell a missing vendor from a missing profile
+        vendor_exists = await db.scalar(_vendor_exists_stmt(user_id))
+        if vendor_exists is None:
+            raise HTTPException(status_code=404, detail="Vendor not found")
         raise HTTPException(status_code=404, detail="Business profile not found")
 
-    # Update values
-    vendor.is_verified = 1
-    business_profile.is_approved = 2
-    business_profile.approved_date = datetime.utcnow() 
+    return review
+
+
+async def _set_vendor_is_active(db: AsyncSession, user_id: str, is_active: bool) -> bool:
+    """
+    Set ven_login.is_active (True means inactive) with one conditional UPDATE.
 
-    db.add(vendor)
-    db.add(business_profile)
+    Returns False without writing when the vendor already has that value, so
+    repeated calls cost a single statement and no row is loaded.
+    """
+    result = await db.execute(
+        update(VendorLogin)
+        .where(
+            VendorLogin.user_id == user_id,
+            VendorLogin.is_active.is_distinct_from(is_active),
+        )
+        .values(is_active=is_active)
+        .returning(VendorLogin.user_id)
+    )
+    if result.first() is not None:
+        await db.commit()
+        return True
+
+    # Nothing changed: either the vendor is missing or already in that state
+    vendor_exists = await db.scalar(_vendor_exists_stmt(user_id))
+    if vendor_exists is None:
+        raise HTTPException(status_code=404, detail="Vendor not found")
+    return False
+
+
+@router.post("/vendor/approve", response_model=dict)
+async def approve_vendor(
+    user_id: str,
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_db),
+):
+    # Update values
+    review = await _update_vendor_and_profile(
+        db,
+        user_id,
+        vendor_values={"is_verified": 1},
+        # approved_date is a naive UTC column; the database supplies the time
+        profile_values={"is_approved": 2, "approved_date": func.timezone("UTC", func.now())},
+    )
     await db.commit()
-    await db.refresh(vendor)
     
     # Send approval email in background
     try:
-        vendor_email = decrypt_data(vendor.email)
-        vendor_name = business_profile.store_name or "Vendor"
-        business_name = business_profile.store_name or "Your Business"
-        reference_id = business_profile.ref_number
+        vendor_email = decrypt_cached(review.email)
+        vendor_name = review.store_name or "Vendor"
+        business_name = review.store_name or "Your Business"
+        reference_id = review.ref_number
         
         background_tasks.add_task(
             send_vendor_approval_email,
@@ -66,52 +175,90 @@ async def approve_vendor(
         )
     except Exception as email_error:
         # Log the error but don't fail the approval process
-        print(f"Warning: Failed to send approval email: {str(email_error)}")
+        logger.warning("Failed to send approval email: %s", email_error, exc_info=email_error)
     
     return {"message": f"Vendor approved successfully. Approval email sent."}
 
 
 
 
-@router.post("/vendor/reject", response_model=dict)
-async def reject_vendor(
-    user_id: str,
-    data: RejectRequest,
+@router.post("/vendor/approve/batch", response_model=VendorBatchActionResponse)
+async def approve_vendors_batch(
+    request: VendorBatchActionRequest,
     background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
 ):
-    # Fetch vendor
-    stmt = select(VendorLogin).where(VendorLogin.user_id == user_id)
-    result = await db.execute(stmt)
-    vendor = result.scalar_one_or_none()
+    user_ids = list(dict.fromkeys(request.user_ids))
+
+    # Only vendors with a business profile are approved, matching the
+    # single-vendor endpoint which rejects the others with a 404
+    vendor_result = await db.execute(
+        update(VendorLogin)
+        .where(
+            VendorLogin.user_id.in_(user_ids),
+            exists().where(BusinessProfile.profile_ref_id == VendorLogin.business_profile_id),
+        )
+        .values(is_verified=1)
+        .returning(VendorLogin.user_id, VendorLogin.email, VendorLogin.business_profile_id)
+    )
+    vendors = vendor_result.all()
 
-    if not vendor:
-        raise HTTPException(status_code=404, detail="Vendor not found")
+    profile_result = await db.execute(
+        update(BusinessProfile)
+        .where(BusinessProfile.profile_ref_id.in_([vendor.business_profile_id for vendor in vendors]))
+        .values(is_approved=2, approved_date=func.timezone("UTC", func.now()))
+        .returning(BusinessProfile.profile_ref_id, BusinessProfile.store_name, BusinessProfile.ref_number)
+    )
+    profiles = {profile.profile_ref_id: profile for profile in profile_result.all()}
+    await db.commit()
 
-    # Fetch business profile
-    profile_stmt = select(BusinessProfile).where(
-        BusinessProfile.profile_ref_id == vendor.business_profile_id
+    # One background task sends every approval email
+    recipients = []
+    for vendor in vendors:
+        business_profile = profiles[vendor.business_profile_id]
+        try:
+            recipients.append({
+                "email": decrypt_cached(vendor.email),
+                "vendor_name": business_profile.store_name or "Vendor",
+                "business_name": business_profile.store_name or "Your Business",
+                "reference_id": business_profile.ref_number,
+            })
+        except Exception as email_error:
+            # Log the error but don't fail the approval process
+            logger.warning("Failed to send approval email: %s", email_error, exc_info=email_error)
+    if recipients:
+        background_tasks.add_task(send_vendor_approval_emails, recipients)
+
+    approved = {vendor.user_id for vendor in vendors}
+    return VendorBatchActionResponse(
+        message=f"{len(approved)} vendor(s) approved successfully. Approval emails sent.",
+        user_ids=[user_id for user_id in user_ids if user_id in approved],
+        not_found=[user_id for user_id in user_ids if user_id not in approved],
     )
-    profile_result = await db.execute(profile_stmt)
-    business_profile = profile_result.scalar_one_or_none()
 
-    if not business_profile:
-        raise HTTPException(status_code=404, detail="Business profile not found")
 
+@router.post("/vendor/reject", response_model=dict)
+async def reject_vendor(
+    user_id: str,
+    data: RejectRequest,
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_db),
+):
     # Update values
-    vendor.is_verified = 0
-    business_profile.is_approved = -1
-    business_profile.reviewer_comment = data.comment
-
-    db.add_all([vendor, business_profile])
+    review = await _update_vendor_and_profile(
+        db,
+        user_id,
+        vendor_values={"is_verified": 0},
+        profile_values={"is_approved": -1, "reviewer_comment": data.comment},
+    )
     await db.commit()
 
     # Send rejection email in background
     try:
-        vendor_email = decrypt_data(vendor.email)
-        vendor_name = business_profile.store_name or "Vendor"
-        business_name = business_profile.store_name or "Your Business"
-        reference_id = business_profile.ref_number
+        vendor_email = decrypt_cached(review.email)
+        vendor_name = review.store_name or "Vendor"
+        business_name = review.store_name or "Your Business"
+        reference_id = review.ref_number
         
         background_tasks.add_task(
             send_vendor_rejection_email,
@@ -123,7 +270,7 @@ async def reject_vendor(
         )
     except Exception as email_error:
         # Log the error but don't fail the rejection process
-        print(f"Warning: Failed to send rejection email: {str(email_error)}")
+        logger.warning("Failed to send rejection email: %s", email_error, exc_info=email_error)
 
     return {"message": f"Vendor rejected successfully. Rejection email sent."}
 
@@ -133,30 +280,13 @@ async def reject_onhold(
     user_id: str,
     db: AsyncSession = Depends(get_db),
 ):
-    # Fetch vendor
-    stmt = select(VendorLogin).where(VendorLogin.user_id == user_id)
-    result = await db.execute(stmt)
-    vendor = result.scalar_one_or_none()
-
-    if not vendor:
-        raise HTTPException(status_code=404, detail="Vendor not found")
-
-    # Fetch business profile
-    profile_stmt = select(BusinessProfile).where(
-        BusinessProfile.profile_ref_id == vendor.business_profile_id
-    )
-    profile_result = await db.execute(profile_stmt)
-    business_profile = profile_result.scalar_one_or_none()
-
-    if not business_profile:
-        raise HTTPException(status_code=404, detail="Business profile not found")
-
     # Update values
-    vendor.is_verified = 0
-    business_profile.is_approved = 1
-   
-
-    db.add_all([vendor, business_profile])
+    await _update_vendor_and_profile(
+        db,
+        user_id,
+        vendor_values={"is_verified": 0},
+        profile_values={"is_approved": 1},
+    )
     await db.commit()
 
     return {"message": f"Vendor onholded successfully"}
@@ -169,24 +299,14 @@ async def soft_delete_vendor(
     db: AsyncSession = Depends(get_db),
 ):
 
-    stmt = select(VendorLogin).where(VendorLogin.user_id == request.user_id)
-    result = await db.execute(stmt)
-    vendor = result.scalar_one_or_none()
-
-    if not vendor:
-        raise HTTPException(status_code=404, detail="Vendor not found")
-
-    if vendor.is_active:
+    # is_active=True means inactive, so soft delete sets it to True
+    if not await _set_vendor_is_active(db, request.user_id, True):
         return VendorActionResponse(
             message=f"Vendor '{request.user_id}' is already inactive.",
             user_id=request.user_id,
             status="inactive"
         )
 
-    vendor.is_active = True
-    db.add(vendor)
-    await db.commit()
-
     return VendorActionResponse(
         message=f"Vendor '{request.user_id}' has been soft deleted (deactivated) successfully.",
         user_id=request.user_id,
@@ -200,24 +320,14 @@ async def restore_vendor(
     db: AsyncSession = Depends(get_db),
 ):
 
-    stmt = select(VendorLogin).where(VendorLogin.user_id == request.user_id)
-    result = await db.execute(stmt)
-    vendor = result.scalar_one_or_none()
-
-    if not vendor:
-        raise HTTPException(status_code=404, detail="Vendor not found")
-
-    if not vendor.is_active:
+    # is_active=False means active
+    if not await _set_vendor_is_active(db, request.user_id, False):
         return VendorActionResponse(
             message=f"Vendor '{request.user_id}' is already active.",
             user_id=request.user_id,
             status="active"
         )
 
-    vendor.is_active = False
-    db.add(vendor)
-    await db.commit()
-
     return VendorActionResponse(
         message=f"Vendor '{request.user_id}' has been restored (activated) successfully.",
         user_id=request.user_id,
@@ -231,29 +341,19 @@ async def get_vendor_status(
     db: AsyncSession = Depends(get_db),
 ):
 
-    stmt = select(VendorLogin).where(VendorLogin.user_id == user_id)
-    result = await db.execute(stmt)
-    vendor = result.scalar_one_or_none()
+    # Fetch only the status fields, with the store name from the business
+    # profile in the same round trip (fallback to username if not found)
+    vendor = (await db.execute(_vendor_status_stmt(user_id))).first()
 
     if not vendor:
         raise HTTPException(status_code=404, detail="Vendor not found")
 
-    # Fetch business profile to get store name
-    profile_stmt = select(BusinessProfile).where(
-        BusinessProfile.profile_ref_id == vendor.business_profile_id
-    )
-    profile_result = await db.execute(profile_stmt)
-    business_profile = profile_result.scalar_one_or_none()
-
-    # Get store name from business profile, fallback to username if not found
-    store_name = business_profile.store_name if business_profile else vendor.username
-
     # Decrypt email before returning
-    decrypted_email = decrypt_data(vendor.email)
+    decrypted_email = decrypt_cached(vendor.email)
 
     return VendorStatusResponse(
         user_id=vendor.user_id,
-        username=store_name,
+        username=vendor.store_name,
         email=decrypted_email,
         is_active=vendor.is_active,
         is_verified=vendor.is_verified,
@@ -266,75 +366,99 @@ async def get_vendor_status(
 async def get_all_products(
     page: int = Query(1, ge=1, description="Page number"),
     per_page: int = Query(10, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page; takes precedence over page"),
     db: AsyncSession = Depends(get_db),
 ):
     # Get total count first
-    count_stmt = (
-        select(func.count(Product.product_id))
-        .join(Category, Product.category_id == Category.category_id)
-        .outerjoin(SubCategory, Product.subcategory_id == SubCategory.subcategory_id)
-        .outerjoin(VendorLogin, Product.vendor_id == VendorLogin.user_id)
-        .outerjoin(BusinessProfile, VendorLogin.business_profile_id == BusinessProfile.profile_ref_id)
-        .outerjoin(Industries, Category.industry_id == Industries.industry_id)
-    )
+    # category_id is a NOT NULL foreign key and the other joins are outer,
+    # so none of them change the number of products
+    count_stmt = select(func.count()).select_from(Product)
     
-    total_result = await db.execute(count_stmt)
-    total_count = total_result.scalar()
+    total_count = product_count_cache.get("all")
+    if total_count is None:
+        total_result = await db.execute(count_stmt)
+        total_count = total_result.scalar()
+        product_count_cache.set("all", total_count)
     
     # Calculate pagination
     total_pages = math.ceil(total_count / per_page)
     offset = (page - 1) * per_page
     
-    # Query to get paginated products with their related data using proper joins
+    # Subcategory and store names are denormalized onto the product row, so
+    # only the category (for its industry) and the industry are joined
     stmt = (
-        select(Product, Category, SubCategory, VendorLogin, BusinessProfile, Industries)
+        select(
+            Product.product_id,
+            Product.vendor_id,
+            Product.slug,
+            Product.category_id,
+            Product.subcategory_id,
+            Product.subcategory_name,
+            Product.store_name,
+            # Only the two JSON fields shown are extracted by Postgres, so the
+            # identification and images documents are never sent or decoded
+            func.coalesce(Product.identification["product_name"].astext, "").label("product_name"),
+            Product.images["urls"][0].astext.label("image_path"),
+            Product.timestamp,
+            Category.category_name,
+            Industries.industry_id,
+            Industries.industry_name,
+        )
         .join(Category, Product.category_id == Category.category_id)
-        .outerjoin(SubCategory, Product.subcategory_id == SubCategory.subcategory_id)
-        .outerjoin(VendorLogin, Product.vendor_id == VendorLogin.user_id)
-        .outerjoin(BusinessProfile, VendorLogin.business_profile_id == BusinessProfile.profile_ref_id)
         .outerjoin(Industries, Category.industry_id == Industries.industry_id)
-        .offset(offset)
-        .limit(per_page)
-        .order_by(Product.timestamp.desc())  # Order by timestamp for consistent pagination
+        # product_id breaks timestamp ties so every row has a fixed position
+        .order_by(Product.timestamp.desc(), Product.product_id.desc())
+        .limit(per_page + 1)  # One extra row tells whether a next page exists
     )
+
+    # A cursor seeks straight to the previous page's last row; page numbers
+    # still work for existing clients but have to skip every earlier row
+    if cursor:
+        stmt = stmt.where(
+            tuple_(Product.timestamp, Product.product_id) < _decode_product_cursor(cursor)
+        )
+    else:
+        stmt = stmt.offset(offset)
     
     result = await db.execute(stmt)
     products_data = result.all()
+
+    next_cursor = None
+    if len(products_data) > per_page:
+        products_data = products_data[:per_page]
+        # timestamp has a server default; a row without one can only be
+        # paged past by number
+        if products_data[-1].timestamp is not None:
+            next_cursor = _encode_product_cursor(products_data[-1])
     
+    # First image paths become full media URLs in one pass over the page
+    product_images = get_media_urls(product.image_path for product in products_data)
+
+    # Rows come from the database, so items skip validation
     products_list = []
-    for product, category, subcategory, vendor_login, business_profile, industry in products_data:
-        # Extract product name from identification JSONB field
-        product_name = product.identification.get('product_name', '') if product.identification else ''
-        
-        # Extract product image from images JSONB field (get first available image from urls array)
-        product_image = None
-        if product.images and "urls" in product.images and product.images["urls"]:
-            # Get the first image URL and convert it to full media URL
-            product_image = get_media_url(product.images["urls"][0])
-        
-        # Get store name from business profile
-        store_name = business_profile.store_name if business_profile else None
-        
-        product_response = AllProductsResponse(
+    for product, product_image in zip(products_data, product_images):
+        product_response = AllProductsResponse.model_construct(
             vendor_id=product.vendor_id,
-            store_name=store_name,
+            store_name=product.store_name,
             product_id=product.product_id,
-            product_name=product_name,
+            product_name=product.product_name,
             product_image=product_image,
             product_slug=product.slug,
-            category_id=category.category_id,
-            category_name=category.category_name,
-            subcategory_id=subcategory.subcategory_id if subcategory else None,
-            subcategory_name=subcategory.subcategory_name if subcategory else None,
-            industry_id=industry.industry_id if industry else None,
-            industry_name=industry.industry_name if industry else None
+            category_id=product.category_id,
+            category_name=product.category_name,
+            subcategory_id=product.subcategory_id,
+            subcategory_name=product.subcategory_name if product.subcategory_id else None,
+            industry_id=product.industry_id,
+            industry_name=product.industry_name
         )
         products_list.append(product_response)
     
-    return AllProductsListResponse(
+    return constructed_response(
+        AllProductsListResponse,
         products=products_list,
         total_count=total_count,
         page=page,
         per_page=per_page,
-        total_pages=total_pages
+        total_pages=total_pages,
+        next_cursor=next_cursor
     )
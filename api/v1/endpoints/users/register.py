@@ -11,7 +11,7 @@ from core.api_response import api_response
 from db.models.general import User, UserVerification
 from db.sessions.database import get_db
 from schemas.register import UserRegisterRequest, UserRegisterResponse, UserVerificationRequest, UserVerificationResponse, ResendVerificationRequest, ResendVerificationResponse
-from services.admin_user import get_config_or_404
+from services.admin_user import get_cached_config
 from utils.email_utils import send_user_verification_email
 from services.user_service import validate_unique_user, generate_verification_tokens
 from utils.auth import hash_password
@@ -70,7 +70,7 @@ async def register_user(
     password_hash = hash_password(user_data.password)
 
     # Get system configuration
-    config = await get_config_or_404(db)
+    config = await get_cached_config(db)
     if not config:
         return api_response(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -156,9 +156,7 @@ async def update_user(
         user.phone_number_hash = phone_number_hash
     
     # Save changes
-    db.add(user)
     await db.commit()
-    await db.refresh(user)
     
     return api_response(
         status_code=status.HTTP_200_OK,
@@ -205,9 +203,7 @@ async def soft_delete_user(
     user.is_active = True
     
     # Save changes
-    db.add(user)
     await db.commit()
-    await db.refresh(user)
     
     return api_response(
         status_code=status.HTTP_200_OK,
@@ -254,9 +250,7 @@ async def restore_user(
     user.is_active = False
     
     # Save changes
-    db.add(user)
     await db.commit()
-    await db.refresh(user)
     
     return api_response(
         status_code=status.HTTP_200_OK,
@@ -1,9 +1,10 @@
 from datetime import datetime, timezone
-from typing import Any, Optional
+from typing import Any, Optional, Type
 
 from fastapi import HTTPException
 from fastapi.encoders import jsonable_encoder
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
+from pydantic import BaseModel
 from starlette.requests import Request
 
 from core.logging_config import get_logger
@@ -65,5 +66,18 @@ def api_response(
     if 400 <= status_code < 500 and not suppress_raise:
         raise HTTPException(status_code=status_code, detail=response_body)
 
-    # Return normal response for other codes
-    return JSONResponse(status_code=status_code, content=response_body)
+    # Return normal response for other codes; the body is already
+    # jsonable-encoded, so orjson can serialize it directly
+    return ORJSONResponse(status_code=status_code, content=response_body)
+
+
+def constructed_response(model: Type[BaseModel], **fields: Any) -> ORJSONResponse:
+    """
+    Response for a model filled from database rows.
+
+    The values are already trusted, so the model (and any nested models in
+    ``fields``, built with ``model_construct`` by the caller) skips
+    validation, and it is returned as a response object so FastAPI does not
+    validate it again against the route's response_model.
+    """
+    return ORJSONResponse(model.model_construct(**fields).model_dump())
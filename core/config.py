@@ -124,6 +124,14 @@ class Settings(BaseSettings):
     POSTGRES_USER: str = "postgres"
     POSTGRES_PASSWORD: str = "postgres"
     POSTGRES_DB: str = "shoppersky"
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 40
+    # Worker processes sharing the database, each with its own pool; only
+    # used to check the pools fit under the server's max_connections
+    DB_WORKERS: int = 1
+    # Set when connecting through PgBouncer in transaction pooling mode;
+    # asyncpg's prepared statement cache doesn't survive connection swaps
+    DB_BEHIND_PGBOUNCER: bool = False
 
     # === Email ===
     SMTP_TLS: bool = True
@@ -2,11 +2,15 @@
 
 # core/logging_config.py
 
+import atexit
+import copy
 import logging
 import os
+import queue
 from datetime import datetime
-from logging import Logger, StreamHandler
-from logging.handlers import TimedRotatingFileHandler
+from logging import Handler, Logger, StreamHandler
+from logging.handlers import QueueHandler, QueueListener, TimedRotatingFileHandler
+from typing import List, Optional
 
 from colorlog import ColoredFormatter
 from pythonjsonlogger.json import JsonFormatter
@@ -30,16 +34,12 @@ LOG_FILE_PATH = os.path.join(
 # Flag to track if initialization message has been logged
 _INIT_MESSAGE_LOGGED = False
 
+# Shared by every logger from get_logger; records are queued here and a
+# listener thread does the console and file writes
+_QUEUE_HANDLER: Optional[QueueHandler] = None
 
-# === Logger Factory Function ===
-def get_logger(name: str) -> Logger:
-    logger = logging.getLogger(name)
-
-    if logger.handlers:
-        return logger  # Avoid adding handlers multiple times
-
-    logger.setLevel(getattr(logging, LOG_LEVEL, logging.DEBUG))
 
+def _build_handlers() -> List[Handler]:
     # === Formatter Configuration ===
     if ENVIRONMENT == "development":
         # Local: Human-readable and colored
@@ -85,9 +85,54 @@ def get_logger(name: str) -> Logger:
     file_handler.setLevel(logging.DEBUG)
     file_handler.setFormatter(file_formatter)
 
+    return [console_handler, file_handler]
+
+
+class _RecordQueueHandler(QueueHandler):
+    """
+    QueueHandler that hands records to the listener unformatted.
+
+    The stock prepare() merges the traceback into msg and drops exc_info, and
+    stringifies dict messages, so JsonFormatter would lose its separate
+    exc_info field and the structured payload. Only %-style arguments are
+    merged here, on a copy, so later changes to them can't leak into the
+    record while it waits in the queue.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        if record.args:
+            record.msg = record.getMessage()
+            record.args = None
+        return record
+
+
+def _get_queue_handler() -> QueueHandler:
+    """
+    Handler that only enqueues records, so logging from a request never
+    waits on stdout or the log file.
+    """
+    global _QUEUE_HANDLER
+    if _QUEUE_HANDLER is None:
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        listener = QueueListener(log_queue, *_build_handlers(), respect_handler_level=True)
+        listener.start()
+        atexit.register(listener.stop)  # Flush what is still queued on shutdown
+        _QUEUE_HANDLER = _RecordQueueHandler(log_queue)
+    return _QUEUE_HANDLER
+
+
+# === Logger Factory Function ===
+def get_logger(name: str) -> Logger:
+    logger = logging.getLogger(name)
+
+    if logger.handlers:
+        return logger  # Avoid adding handlers multiple times
+
+    logger.setLevel(getattr(logging, LOG_LEVEL, logging.DEBUG))
+
     # === Add Handlers ===
-    logger.addHandler(console_handler)
-    logger.addHandler(file_handler)
+    logger.addHandler(_get_queue_handler())
     logger.propagate = False  # Prevent duplicate logs in root
 
     # Optional: disable noisy loggers
@@ -3,8 +3,9 @@ from typing import Any, Dict, List, Optional
 import uuid
 
 from sqlalchemy.ext.mutable import MutableDict
-from sqlalchemy import Boolean, DateTime, Integer, String, Text, ForeignKey, Enum as SQLAlchemyEnum, UniqueConstraint, func, event
+from sqlalchemy import DDL, Boolean, Index, DateTime, Integer, String, Text, ForeignKey, Enum as SQLAlchemyEnum, UniqueConstraint, func, event
 from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.schema import CreateIndex
 from sqlalchemy.dialects.postgresql import JSONB, ARRAY
 from slugify import slugify
 from db.models.base import Base
@@ -465,6 +466,12 @@ class Product(Base):
 
     slug: Mapped[str] = mapped_column(String, unique=True, nullable=False)
 
+    # Denormalized display names, kept in sync by the database triggers
+    # installed below so product reads don't need to join for them
+    category_name: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    subcategory_name: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    store_name: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+
     identification: Mapped[Dict[str, Any]] = mapped_column(JSONB, nullable=False)
     descriptions: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSONB)
     pricing: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSONB)
@@ -486,9 +493,178 @@ class Product(Base):
         DateTime(timezone=True), server_default=func.now()
     )
 
-    # Relationships
-    category: Mapped["Category"] = relationship(back_populates="products")
-    subcategory: Mapped[Optional["SubCategory"]] = relationship(back_populates="products")
+    # Relationships. Names are denormalized onto the row, so nothing should
+    # lazy-load these; an accidental access fails loudly instead of adding a
+    # query per product.
+    category: Mapped["Category"] = relationship(
+        back_populates="products", lazy="raise_on_sql"
+    )
+    subcategory: Mapped[Optional["SubCategory"]] = relationship(
+        back_populates="products", lazy="raise_on_sql"
+    )
+
+
+# Keep Product.category_name / subcategory_name / store_name in sync with
+# their source tables. Runs after every create_all, so each statement is
+# idempotent; it also adds the columns and backfills them on databases
+# created before they existed.
+PRODUCT_NAME_SYNC_DDL = [
+    "ALTER TABLE ven_products ADD COLUMN IF NOT EXISTS category_name VARCHAR",
+    "ALTER TABLE ven_products ADD COLUMN IF NOT EXISTS subcategory_name VARCHAR",
+    "ALTER TABLE ven_products ADD COLUMN IF NOT EXISTS store_name VARCHAR",
+    """
+    CREATE OR REPLACE FUNCTION ven_products_fill_names() RETURNS trigger AS $$
+    BEGIN
+        SELECT category_name INTO NEW.category_name
+        FROM sa_categories WHERE category_id = NEW.category_id;
+        SELECT subcategory_name INTO NEW.subcategory_name
+        FROM sa_subcategories WHERE subcategory_id = NEW.subcategory_id;
+        SELECT bp.store_name INTO NEW.store_name
+        FROM ven_login v
+        JOIN ven_businessprofile bp ON bp.profile_ref_id = v.business_profile_id
+        WHERE v.user_id = NEW.vendor_id;
+        RETURN NEW;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+    "DROP TRIGGER IF EXISTS trg_ven_products_fill_names ON ven_products",
+    """
+    CREATE TRIGGER trg_ven_products_fill_names
+    BEFORE INSERT OR UPDATE OF category_id, subcategory_id, vendor_id ON ven_products
+    FOR EACH ROW EXECUTE FUNCTION ven_products_fill_names()
+    """,
+    """
+    CREATE OR REPLACE FUNCTION sa_categories_sync_product_names() RETURNS trigger AS $$
+    BEGIN
+        UPDATE ven_products SET category_name = NEW.category_name
+        WHERE category_id = NEW.category_id;
+        RETURN NEW;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+    "DROP TRIGGER IF EXISTS trg_sa_categories_sync_product_names ON sa_categories",
+    """
+    CREATE TRIGGER trg_sa_categories_sync_product_names
+    AFTER UPDATE OF category_name ON sa_categories
+    FOR EACH ROW WHEN (OLD.category_name IS DISTINCT FROM NEW.category_name)
+    EXECUTE FUNCTION sa_categories_sync_product_names()
+    """,
+    """
+    CREATE OR REPLACE FUNCTION sa_subcategories_sync_product_names() RETURNS trigger AS $$
+    BEGIN
+        UPDATE ven_products SET subcategory_name = NEW.subcategory_name
+        WHERE subcategory_id = NEW.subcategory_id;
+        RETURN NEW;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+    "DROP TRIGGER IF EXISTS trg_sa_subcategories_sync_product_names ON sa_subcategories",
+    """
+    CREATE TRIGGER trg_sa_subcategories_sync_product_names
+    AFTER UPDATE OF subcategory_name ON sa_subcategories
+    FOR EACH ROW WHEN (OLD.subcategory_name IS DISTINCT FROM NEW.subcategory_name)
+    EXECUTE FUNCTION sa_subcategories_sync_product_names()
+    """,
+    """
+    CREATE OR REPLACE FUNCTION ven_businessprofile_sync_product_names() RETURNS trigger AS $$
+    BEGIN
+        UPDATE ven_products p SET store_name = NEW.store_name
+        FROM ven_login v
+        WHERE v.business_profile_id = NEW.profile_ref_id AND p.vendor_id = v.user_id;
+        RETURN NEW;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+    "DROP TRIGGER IF EXISTS trg_ven_businessprofile_sync_product_names ON ven_businessprofile",
+    """
+    CREATE TRIGGER trg_ven_businessprofile_sync_product_names
+    AFTER UPDATE OF store_name ON ven_businessprofile
+    FOR EACH ROW WHEN (OLD.store_name IS DISTINCT FROM NEW.store_name)
+    EXECUTE FUNCTION ven_businessprofile_sync_product_names()
+    """,
+    # A vendor linked to (or moved to) another business profile after
+    # listing products takes that profile's store name
+    """
+    CREATE OR REPLACE FUNCTION ven_login_sync_product_names() RETURNS trigger AS $$
+    BEGIN
+        UPDATE ven_products SET store_name = (
+            SELECT store_name FROM ven_businessprofile
+            WHERE profile_ref_id = NEW.business_profile_id
+        )
+        WHERE vendor_id = NEW.user_id;
+        RETURN NEW;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+    "DROP TRIGGER IF EXISTS trg_ven_login_sync_product_names ON ven_login",
+    """
+    CREATE TRIGGER trg_ven_login_sync_product_names
+    AFTER UPDATE OF business_profile_id ON ven_login
+    FOR EACH ROW WHEN (OLD.business_profile_id IS DISTINCT FROM NEW.business_profile_id)
+    EXECUTE FUNCTION ven_login_sync_product_names()
+    """,
+    # Backfill rows written before the columns existed
+    """
+    UPDATE ven_products p SET
+        category_name = (
+            SELECT c.category_name FROM sa_categories c
+            WHERE c.category_id = p.category_id
+        ),
+        subcategory_name = (
+            SELECT s.subcategory_name FROM sa_subcategories s
+            WHERE s.subcategory_id = p.subcategory_id
+        ),
+        store_name = (
+            SELECT bp.store_name FROM ven_login v
+            JOIN ven_businessprofile bp ON bp.profile_ref_id = v.business_profile_id
+            WHERE v.user_id = p.vendor_id
+        )
+    WHERE p.category_name IS NULL
+    """,
+]
+
+for _statement in PRODUCT_NAME_SYNC_DDL:
+    event.listen(
+        Base.metadata,
+        "after_create",
+        DDL(_statement).execute_if(dialect="postgresql"),
+    )
+
+
+# Lookup indexes added after the tables first shipped. create_all only
+# builds indexes together with a new table, so these are also created
+# IF NOT EXISTS on every start to reach existing databases.
+LOOKUP_INDEXES = [
+    # store_slug -> profile_ref_id resolved from the index alone when
+    # joining a store's products
+    Index(
+        "ix_ven_businessprofile_store_slug_ref",
+        BusinessProfile.store_slug,
+        postgresql_include=["profile_ref_id"],
+    ),
+    # Vendor-scoped product listings
+    Index("ix_ven_products_vendor_id", Product.vendor_id),
+    # Category and subcategory listings are keyset-paginated on product_id,
+    # so each page is a range scan that stops after `limit` rows
+    Index("ix_ven_products_category_product", Product.category_id, Product.product_id),
+    Index("ix_ven_products_subcategory_product", Product.subcategory_id, Product.product_id),
+    # Categories of an industry (industry pages, category -> industry joins)
+    Index("ix_sa_categories_industry_id", Category.industry_id),
+    # Subcategories of a category; the category listings and stats count
+    # them through a category_id join
+    Index("ix_sa_subcategories_category_id", SubCategory.category_id),
+    # Admin all-products listing, newest first; product_id is the keyset
+    # tie-breaker, so both page styles read the index in order
+    Index("ix_ven_products_timestamp_product", Product.timestamp.desc(), Product.product_id.desc()),
+]
+
+
+@event.listens_for(Base.metadata, "after_create")
+def create_lookup_indexes(target, connection, **kw):
+    if connection.dialect.name != "postgresql":
+        return
+    for index in LOOKUP_INDEXES:
+        connection.execute(CreateIndex(index, if_not_exists=True))
 
 
 class EnquiryStatus(Enum):
@@ -4,8 +4,12 @@ import logging
 from logging import Logger
 from typing import AsyncGenerator
 
+import orjson
+
+from sqlalchemy import text
 from sqlalchemy.exc import OperationalError
 from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
     AsyncEngine,
     AsyncSession,
     async_sessionmaker,
@@ -27,19 +31,33 @@ from db.models import Base
 logging.basicConfig(level=logging.INFO)
 logger: Logger = logging.getLogger(__name__)
 
+
+def _json_serializer(value) -> str:
+    # Non-string keys are stringified as the stdlib json module does
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 # Create async engine with optimized pool settings
 engine: AsyncEngine = create_async_engine(
     url=str(settings.DATABASE_URL),
     echo=False,  # settings.environment == "development",  # Enable SQL logging in development
     pool_size=(
-        5 if settings.ENVIRONMENT == "production" else 3
+        settings.DB_POOL_SIZE if settings.ENVIRONMENT == "production" else 3
     ),  # Smaller pool for dev
-    max_overflow=10,  # Allow temporary extra connections
+    max_overflow=settings.DB_MAX_OVERFLOW,  # Allow temporary extra connections
     pool_timeout=30,  # Timeout for acquiring a connection
     pool_pre_ping=True,  # Check connection health before use
     pool_recycle=1800,  # Close and reopen connections after 30 minutes
+    pool_use_lifo=True,  # Reuse warm connections; idle extras age out via recycle
     isolation_level="READ COMMITTED",  # Default isolation level
+    # JSONB columns (product identification, images, ...) are encoded and
+    # decoded with orjson instead of the stdlib json module
+    json_serializer=_json_serializer,
+    json_deserializer=orjson.loads,
     future=True,  # Enable asyncio support
+    connect_args=(
+        {"statement_cache_size": 0} if settings.DB_BEHIND_PGBOUNCER else {}
+    ),
 )
 
 # Create async session factory
@@ -92,6 +110,30 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
         yield session
 
 
+async def _check_pool_capacity(conn: AsyncConnection) -> None:
+    """Warn when every worker's full pool would exceed max_connections.
+
+    Behind PgBouncer the server-side limit applies to PgBouncer's own pool,
+    so the check is skipped.
+    """
+    if settings.DB_BEHIND_PGBOUNCER:
+        return
+
+    max_connections = int(await conn.scalar(text("SHOW max_connections")))
+    per_worker = engine.pool.size() + settings.DB_MAX_OVERFLOW
+    required = per_worker * settings.DB_WORKERS
+    if required > max_connections:
+        logger.warning(
+            "Connection pools need up to %d connections (%d workers x %d) but "
+            "the server allows %d; lower DB_POOL_SIZE/DB_MAX_OVERFLOW or put "
+            "PgBouncer in front",
+            required,
+            settings.DB_WORKERS,
+            per_worker,
+            max_connections,
+        )
+
+
 async def init_db() -> None:
     """Initialize the database by creating all tables.
 
@@ -106,6 +148,7 @@ async def init_db() -> None:
         async with engine.begin() as conn:
             logger.info("Creating database tables if they do not exist")
             await conn.run_sync(Base.metadata.create_all, checkfirst=True)
+            await _check_pool_capacity(conn)
     except OperationalError as e:
         logger.error("Failed to connect to database: %s", str(e))
         raise
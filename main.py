@@ -2,7 +2,7 @@ import os
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.responses import Response
@@ -12,6 +12,7 @@ from api.v1.routes import api_router
 from core.config import settings
 from core.config_log import setup_logging
 from core.request_context import request_context
+from db.sessions.database import engine
 from lifespan import lifespan
 from utils.execution_time import ExecutionTimeMiddleware
 
@@ -25,6 +26,7 @@ def create_app() -> FastAPI:
         version="0.1.0",
         description="Shoppersky Service API",
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
         debug=settings.ENVIRONMENT == "development",
         redirect_slashes=True,
         swagger_ui_parameters={
@@ -53,6 +55,12 @@ def create_app() -> FastAPI:
     async def health_check() -> dict[str, str]:
         return {"status": "healthy", "message": "API is running fine!"}
 
+    if settings.ENVIRONMENT != "production":
+
+        @fastapi_app.get("/health/db-pool", tags=["System"])
+        async def db_pool_status() -> dict[str, str]:
+            return {"status": engine.pool.status()}
+
     fastapi_app.include_router(api_router)
 
     # Configure CORS
@@ -65,6 +73,7 @@ def create_app() -> FastAPI:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=["X-Next-Cursor"],
     )
 
     return fastapi_app
@@ -21,11 +21,17 @@ from utils.validators import (
 )
 
 
+# sa_adminusers.email is String(255) and stores the Fernet token of the
+# address. A token for n bytes is 4 * ceil((57 + 16 * ceil((n + 1) / 16)) / 3)
+# characters: 248 at 127 bytes, 268 at 128.
+ADMIN_EMAIL_MAX_BYTES = 127
+
+
 class AdminRegisterRequest(BaseModel):
     username: str = Field(
         ...,
         min_length=3,
-        max_length=255,
+        max_length=32,
         title="Username",
         description="Unique username for the admin. Must be 4-32 characters, and start with 3 letters. Letters, numbers, spaces, and hyphens are allowed.",
     )
@@ -81,6 +87,11 @@ class AdminRegisterRequest(BaseModel):
         v = normalize_whitespace(v)
         if not v:
             raise ValueError("Email cannot be empty.")
+        # The Fernet token of the email has to fit sa_adminusers.email
+        if len(v.encode()) > ADMIN_EMAIL_MAX_BYTES:
+            raise ValueError(
+                f"Email must be at most {ADMIN_EMAIL_MAX_BYTES} characters long."
+            )
         # Use your advanced email validator
         EmailValidator.validate(str(v))
         return v.lower()
@@ -137,11 +137,12 @@ class ProductByCategoryResponse(BaseModel):
 class ProductByCategoryListResponse(BaseModel):
     """Response model for products by category or subcategory"""
     products: List[ProductByCategoryResponse]
-    total_count: int
+    total_count: int  # Exact up to 1000 matches, planner estimate above that
     slug: str
     slug_type: str  # "category" or "subcategory"
     category_name: str
     subcategory_name: Optional[str] = None
+    next_cursor: Optional[str] = None
 
 
 class ProductSearchResponse(BaseModel):
@@ -183,6 +184,7 @@ class AllProductsListResponse(BaseModel):
     page: int
     per_page: int
     total_pages: int
+    next_cursor: Optional[str] = None
 
 
 class VendorProductsResponse(BaseModel):
@@ -194,4 +196,5 @@ class VendorProductsResponse(BaseModel):
     banner_subtitle: Optional[str]
     products: List[ProductResponse]
     total_count: int
+    next_cursor: Optional[str] = None
 
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import List, Optional
 
 
 class VendorActionRequest(BaseModel):
@@ -7,6 +7,18 @@ class VendorActionRequest(BaseModel):
     user_id: str = Field(..., description="Vendor user ID from ven_login table", min_length=1, max_length=6)
 
 
+class VendorBatchActionRequest(BaseModel):
+    """Schema for actions applied to several vendors at once"""
+    user_ids: List[str] = Field(..., description="Vendor user IDs from ven_login table", min_length=1, max_length=100)
+
+
+class VendorBatchActionResponse(BaseModel):
+    """Schema for batch vendor action responses"""
+    message: str = Field(..., description="Action result message")
+    user_ids: List[str] = Field(..., description="Vendor user IDs the action was applied to")
+    not_found: List[str] = Field(default_factory=list, description="Requested IDs without a vendor and business profile")
+
+
 class VendorActionResponse(BaseModel):
     """Schema for vendor management action responses"""
     message: str = Field(..., description="Action result message")
@@ -3,6 +3,7 @@ import string
 from datetime import datetime, timezone
 from typing import Tuple
 
+import bcrypt
 from pydantic import EmailStr
 from passlib.context import CryptContext
 
@@ -13,6 +14,9 @@ from utils.email_utils import send_admin_welcome_email
 logger = get_logger(__name__)
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# passlib's default bcrypt cost, so hashes made here verify through pwd_context
+BCRYPT_ROUNDS = 12
+
 
 def generate_admin_password(length: int = 6) -> str:
     """
@@ -42,7 +46,11 @@ def hash_admin_password(password: str) -> str:
     Returns:
         str: Hashed password
     """
-    hashed = pwd_context.hash(password)
+    # Straight to the bcrypt C extension; bcrypt only reads 72 bytes, which
+    # passlib would also truncate to
+    hashed = bcrypt.hashpw(
+        password.encode("utf-8")[:72], bcrypt.gensalt(BCRYPT_ROUNDS)
+    ).decode("utf-8")
     logger.info("Password hashed successfully")
     return hashed
 
@@ -20,12 +20,23 @@ from schemas.admin_user import (
     AdminDeleteResponse,
     AdminRestoreResponse
 )
+from utils.cache import TTLCache
 from utils.id_generators import decrypt_data, hash_data, encrypt_data
 from fastapi import UploadFile
 from schemas.admin_user import AdminProfilePictureUploadResponse
 from utils.file_uploads import save_uploaded_file, remove_file_if_exists, get_media_url
 from core.config import settings
 
+# Role names treated as the single Super Admin role
+SUPERADMIN_ROLE_NAMES = {"superadmin", "super admin"}
+
+# Roles and the system config rarely change, so registration reads them from
+# these per-process caches; the role and config endpoints clear them on write
+REFERENCE_CACHE_TTL = 300
+role_cache = TTLCache(ttl=REFERENCE_CACHE_TTL, maxsize=256)
+config_cache = TTLCache(ttl=REFERENCE_CACHE_TTL, maxsize=1)
+
+
 async def get_admin_user_analytics(
     db: AsyncSession,
 ) -> Row[Tuple[int, Any, Any, Any, Any, Any, Any, datetime, datetime]]:
@@ -85,22 +96,6 @@ async def get_daily_registrations(
     return results.all()
 
 
-async def validate_unique_user(
-    db: AsyncSession, email_hash: str
-) -> JSONResponse | None:
-    user_query = await db.execute(
-        select(AdminUser).where(AdminUser.email_hash == email_hash)
-        
-    )
-    if user_query.scalar_one_or_none():
-        return api_response(
-            status_code=status.HTTP_409_CONFLICT,
-            message="User with the given email already exists.",
-            log_error=True,
-        )
-    return None
-
-
 async def validate_role(db: AsyncSession, role_id: str) -> JSONResponse | Role:
     role_query = await db.execute(select(Role).where(Role.role_id == role_id))
     role = role_query.scalar_one_or_none()
@@ -119,25 +114,36 @@ async def validate_role(db: AsyncSession, role_id: str) -> JSONResponse | Role:
     return role
 
 
+async def get_cached_role(
+    db: AsyncSession,
+    role_id: Optional[str] = None,
+    role_name: Optional[str] = None,
+) -> Optional[Row]:
+    """Role id, name and status by id or name; misses are not cached"""
+    key = ("id", role_id) if role_id is not None else ("name", role_name)
+    role = role_cache.get(key)
+    if role is None:
+        condition = Role.role_id == role_id if role_id is not None else Role.role_name == role_name
+        result = await db.execute(
+            select(Role.role_id, Role.role_name, Role.role_status).where(condition).limit(1)
+        )
+        role = result.first()
+        if role is not None:
+            role_cache.set(key, role)
+    return role
 
 
-async def validate_superadmin_uniqueness(
-    db: AsyncSession, role: Role
-) -> JSONResponse | None:
-    if role.role_name.lower() in {"superadmin", "super admin"}:
-        superadmin_query = await db.execute(
-            select(AdminUser).where(AdminUser.role_id == role.role_id)
+async def get_cached_config(db: AsyncSession) -> Optional[Row]:
+    """Config fields used at registration; a missing config is not cached"""
+    config = config_cache.get("config")
+    if config is None:
+        result = await db.execute(
+            select(Config.logo_url, Config.global_180_day_flag).limit(1)
         )
-        if superadmin_query.scalar_one_or_none():
-            return api_response(
-                status_code=status.HTTP_409_CONFLICT,
-                message=(
-                    "Super Admin already exists. Only one Super Admin is allowed. "
-                    "Please register with a different role."
-                ),
-                log_error=True,
-            )
-    return None
+        config = result.first()
+        if config is not None:
+            config_cache.set("config", config)
+    return config
 
 
 async def get_config_or_404(
@@ -159,10 +165,7 @@ async def get_user_by_id(
     db: AsyncSession, user_id: str
 ) -> JSONResponse | AdminUser:
     """Find a user by ID and return either the user or an error response"""
-    result = await db.execute(
-        select(AdminUser).where(AdminUser.user_id == user_id)
-    )
-    user = result.scalar_one_or_none()
+    user = await db.get(AdminUser, user_id)
     if not user:
         return api_response(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -625,10 +628,7 @@ async def restore_admin_user(
 ) -> JSONResponse | AdminRestoreResponse:
     """Restore a soft deleted admin user"""
     # Get the user (including soft deleted ones)
-    result = await db.execute(
-        select(AdminUser).where(AdminUser.user_id == user_id)
-    )
-    user = result.scalar_one_or_none()
+    user = await db.get(AdminUser, user_id)
     
     if not user:
         return api_response(
@@ -691,10 +691,7 @@ async def hard_delete_admin_user(
 ) -> JSONResponse | AdminDeleteResponse:
     """Permanently delete an admin user"""
     # Get the user (including soft deleted ones)
-    result = await db.execute(
-        select(AdminUser).where(AdminUser.user_id == user_id)
-    )
-    user = result.scalar_one_or_none()
+    user = await db.get(AdminUser, user_id)
     
     if not user:
         return api_response(
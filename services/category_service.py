@@ -2,10 +2,11 @@ import re
 from typing import Optional
 
 from fastapi import HTTPException, status
-from sqlalchemy import func, select
+from sqlalchemy import exists, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from db.models.superadmin import Category, SubCategory
+from utils.cache import TTLCache
 from utils.security_validators import (
     contains_sql_injection,
     contains_xss,
@@ -19,6 +20,12 @@ from utils.validators import (
     validate_length,
 )
 
+# Category listing and stats payloads keyed by (endpoint, filter). Anything
+# that commits a category, subcategory or industry change clears it.
+CATEGORY_CACHE_TTL = 300
+category_cache = TTLCache(ttl=CATEGORY_CACHE_TTL, maxsize=64)
+
+
 def validate_category_data(
     name: str,
     slug: Optional[str],
@@ -158,98 +165,59 @@ def validate_category_data(
 
 
 # === Category Checking ===
-async def check_category_name_exists(db: AsyncSession, name: str) -> bool:
-    result = await db.execute(
-        select(Category).where(
-            func.lower(Category.category_name) == name.strip().lower()
-        )
-    )
-    if result.scalars().first():
-        raise HTTPException(
-            status.HTTP_400_BAD_REQUEST,
-            detail="Category name cannot be same as an existing category name.",
-        )
-    return False
-
-
-async def check_category_slug_exists(db: AsyncSession, slug: str) -> bool:
-    result = await db.execute(
-        select(Category).where(
-            func.lower(Category.category_slug) == slug.strip().lower()
-        )
-    )
-    if result.scalars().first():
-        raise HTTPException(
-            status.HTTP_400_BAD_REQUEST,
-            detail="Category slug cannot be same as an existing category slug.",
-        )
-    return False
-
-
-async def check_category_description_exists(
-    db: AsyncSession, description: str
-) -> bool:
-    # Skip validation if description is None or empty
-    if not description or not description.strip():
-        return False
-        
-    result = await db.execute(
-        select(Category).where(
-            func.lower(Category.category_description)
-            == description.strip().lower()
-        )
-    )
-    if result.scalars().first():
-        raise HTTPException(
-            status.HTTP_400_BAD_REQUEST,
-            detail="Category description cannot be same as an existing category description.",
-        )
-    return False
-
-
-async def check_category_meta_title_exists(
-    db: AsyncSession, meta_title: str
-) -> bool:
-    # Skip validation if meta_title is None or empty
-    if not meta_title or not meta_title.strip():
-        return False
-        
-    result = await db.execute(
-        select(Category).where(
-            func.lower(Category.category_meta_title)
-            == meta_title.strip().lower()
-        )
-    )
-    if result.scalars().first():
-        raise HTTPException(
-            status.HTTP_400_BAD_REQUEST,
-            detail="Category meta title cannot be same as an existing category meta title.",
-        )
-    return False
+# Fields a new category or subcategory must not share with any existing
+# category or subcategory, in the order conflicts are reported
+CONFLICT_FIELDS = ("name", "slug", "description", "meta_title", "meta_description")
 
 
-async def check_category_meta_description_exists(
-    db: AsyncSession, meta_description: str
-) -> bool:
-    # Skip validation if meta_description is None or empty
-    if not meta_description or not meta_description.strip():
-        return False
-        
-    result = await db.execute(
-        select(Category).where(
-            func.lower(Category.category_meta_description)
-            == meta_description.strip().lower()
-        )
-    )
-    if result.scalars().first():
-        raise HTTPException(
-            status.HTTP_400_BAD_REQUEST,
-            detail=(
-                "Category meta description cannot be same as an "
-                "existing category meta description."
-            ),
-        )
-    return False
+async def find_category_conflict(
+    db: AsyncSession,
+    name: str,
+    slug: str,
+    description: Optional[str] = None,
+    meta_title: Optional[str] = None,
+    meta_description: Optional[str] = None,
+    is_subcategory: bool = False,
+) -> str | None:
+    """
+    Check a new category or subcategory against every category and
+    subcategory in a single query and return the first conflict message,
+    comparing case-insensitively and skipping empty optional fields.
+    """
+    values = {
+        "name": name,
+        "slug": slug,
+        "description": description,
+        "meta_title": meta_title,
+        "meta_description": meta_description,
+    }
+    prefix = "Subcategory" if is_subcategory else "Category"
+
+    checks = []
+    messages = {}
+    for model, table in ((Category, "category"), (SubCategory, "subcategory")):
+        for field in CONFLICT_FIELDS:
+            value = (values[field] or "").strip().lower()
+            if not value:
+                continue
+            column = getattr(model, f"{table}_{field}")
+            key = f"{table}_{field}"
+            label = field.replace("_", " ")
+            checks.append(
+                exists()
+                .where(func.lower(func.trim(column)) == value)
+                .label(key)
+            )
+            messages[key] = (
+                f"{prefix} {label} cannot be same as an existing {table} {label}."
+            )
+
+    result = await db.execute(select(*checks))
+    row = result.one()._mapping
+    for key, message in messages.items():
+        if row[key]:
+            return message
+    return None
 
 
 # === Subcategory Checking ===
@@ -0,0 +1,19 @@
+"""
+Product Service
+
+Shared state for the product endpoints.
+"""
+
+from utils.cache import TTLCache
+
+# Product detail responses, keyed by ("id", product_id) and ("slug", slug).
+# They carry the category and subcategory names the database copies onto
+# each product, so renaming or removing a category clears it as well.
+PRODUCT_CACHE_TTL = 600
+product_cache = TTLCache(ttl=PRODUCT_CACHE_TTL, maxsize=2048)
+
+# Total for the admin all-products listing. Paging through the list repeats
+# the same count, so it is reused for a short window instead of re-run per
+# page; creating products clears it.
+PRODUCT_COUNT_CACHE_TTL = 30
+product_count_cache = TTLCache(ttl=PRODUCT_COUNT_CACHE_TTL, maxsize=1)
@@ -42,8 +42,7 @@ async def validate_unique_user(db: AsyncSession, email_hash: str):
 
 
 async def validate_category(db: AsyncSession, category_id: str) -> JSONResponse | Category:
-    category_query = await db.execute(select(Category).where(Category.category_id == category_id))
-    category = category_query.scalar_one_or_none()
+    category = await db.get(Category, category_id)
     if not category:
         return api_response(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -0,0 +1,34 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from schemas.admin_user import ADMIN_EMAIL_MAX_BYTES, AdminRegisterRequest
+
+app = FastAPI()
+
+
+@app.post("/register")
+async def register(user_data: AdminRegisterRequest) -> dict:
+    return {"email": user_data.email}
+
+
+client = TestClient(app)
+
+
+def _email(length: int) -> str:
+    # 60-character local part and a domain padded to the requested length
+    local = "a" * 60
+    domain_label = "b" * (length - len(local) - len("@") - len(".com"))
+    return f"{local}@{domain_label}.com"
+
+
+def test_register_rejects_email_whose_token_overflows_column():
+    email = _email(ADMIN_EMAIL_MAX_BYTES + 1)
+    assert len(email.encode()) == 128
+
+    response = client.post(
+        "/register",
+        json={"username": "Admin One", "email": email, "role_id": "ABC123"},
+    )
+
+    assert response.status_code == 422
+    assert f"at most {ADMIN_EMAIL_MAX_BYTES} characters" in response.text
@@ -2,7 +2,7 @@ import smtplib
 from dataclasses import dataclass
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Iterable, Optional, Tuple, Union
 
 from jinja2 import Environment, FileSystemLoader, select_autoescape
 from pydantic import EmailStr
@@ -100,40 +100,94 @@ class EmailSender:
             logger.error("SMTP connection/login failed: %s", e)
             return None
 
-    def send_email(
+    def _build_message(
         self,
         to: EmailStr,
         subject: str,
         template_file: str,
         context: Dict[str, Any],
-    ) -> bool:
-        """Send a rendered HTML email to a recipient."""
-        server = self._connect_smtp()
-        if not server:
-            return False
-
+    ) -> Optional[str]:
+        """Render a template into a MIME message string, or None on failure."""
         html = self._render_template(template_file, context)
         if not html:
-            return False
+            return None
 
         msg = MIMEMultipart()
         msg["From"] = self.config.from_email
         msg["To"] = to
         msg["Subject"] = subject
         msg.attach(MIMEText(html, "html"))
+        return msg.as_string()
+
+    def _quit(self, server: Union[smtplib.SMTP, smtplib.SMTP_SSL]) -> None:
+        try:
+            server.quit()
+        except Exception as e:
+            logger.warning("Failed to close SMTP connection: %s", e)
+
+    def send_email(
+        self,
+        to: EmailStr,
+        subject: str,
+        template_file: str,
+        context: Dict[str, Any],
+    ) -> bool:
+        """Send a rendered HTML email to a recipient."""
+        message = self._build_message(to, subject, template_file, context)
+        if not message:
+            return False
+
+        server = self._connect_smtp()
+        if not server:
+            return False
 
         try:
-            server.sendmail(self.config.from_email, to, msg.as_string())
+            server.sendmail(self.config.from_email, to, message)
             logger.info("Email sent to %s", to)
             return True
         except Exception as e:
             logger.error("Failed to send email: %s", e)
             return False
         finally:
-            try:
-                server.quit()
-            except Exception as e:
-                logger.warning("Failed to close SMTP connection: %s", e)
+            self._quit(server)
+
+    def send_emails(
+        self,
+        messages: Iterable[Tuple[EmailStr, str, str, Dict[str, Any]]],
+    ) -> int:
+        """
+        Send several rendered HTML emails over one SMTP connection.
+
+        Each message is a (to, subject, template_file, context) tuple. The
+        connection and TLS handshake are paid once for the whole batch, and
+        a failure for one recipient does not stop the rest.
+
+        Returns the number of emails sent.
+        """
+        rendered = []
+        for to, subject, template_file, context in messages:
+            message = self._build_message(to, subject, template_file, context)
+            if message:
+                rendered.append((to, message))
+        if not rendered:
+            return 0
+
+        server = self._connect_smtp()
+        if not server:
+            return 0
+
+        sent = 0
+        try:
+            for to, message in rendered:
+                try:
+                    server.sendmail(self.config.from_email, to, message)
+                    logger.info("Email sent to %s", to)
+                    sent += 1
+                except Exception as e:
+                    logger.error("Failed to send email to %s: %s", to, e)
+        finally:
+            self._quit(server)
+        return sent
 
 
 # Configuration from settings
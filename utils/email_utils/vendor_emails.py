@@ -1,7 +1,7 @@
 """Vendor email functions for Shoppersky."""
 
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Iterable, Optional
 
 from pydantic import EmailStr
 
@@ -197,6 +197,29 @@ def send_vendor_employee_credentials_email(
     return success
 
 
+APPROVAL_EMAIL_SUBJECT = "Your Shoppersky Vendor Application Has Been Approved!"
+
+
+def _vendor_approval_context(
+    email: EmailStr,
+    vendor_name: str,
+    business_name: str,
+    reference_id: str,
+    vendor_portal_url: Optional[str] = None,
+) -> dict:
+    """Template context for vendor_approval_email.html."""
+    return {
+        "vendor_name": vendor_name,
+        "business_name": business_name,
+        "email": email,
+        "reference_id": reference_id,
+        "vendor_portal_url": vendor_portal_url or settings.VENDOR_FRONTEND_URL,
+        "approval_date": datetime.now(tz=timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC"),
+        "current_year": str(datetime.now(tz=timezone.utc).year),
+        "support_email": settings.SUPPORT_EMAIL,
+    }
+
+
 def send_vendor_approval_email(
     email: EmailStr,
     vendor_name: str,
@@ -217,25 +240,13 @@ def send_vendor_approval_email(
     Returns:
         bool: True if email was sent successfully, False otherwise
     """
-    if not vendor_portal_url:
-        vendor_portal_url = settings.VENDOR_FRONTEND_URL
-
-    context = {
-        "vendor_name": vendor_name,
-        "business_name": business_name,
-        "email": email,
-        "reference_id": reference_id,
-        "vendor_portal_url": vendor_portal_url,
-        "approval_date": datetime.now(tz=timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC"),
-        "current_year": str(datetime.now(tz=timezone.utc).year),
-        "support_email": settings.SUPPORT_EMAIL,
-    }
-
     success = email_sender.send_email(
         to=email,
-        subject="Your Shoppersky Vendor Application Has Been Approved!",
+        subject=APPROVAL_EMAIL_SUBJECT,
         template_file="vendor_approval_email.html",
-        context=context,
+        context=_vendor_approval_context(
+            email, vendor_name, business_name, reference_id, vendor_portal_url
+        ),
     )
 
     if not success:
@@ -244,6 +255,36 @@ def send_vendor_approval_email(
     return success
 
 
+def send_vendor_approval_emails(recipients: Iterable[dict]) -> int:
+    """
+    Send approval emails for a batch of vendors over one SMTP connection.
+
+    Args:
+        recipients: Keyword arguments for send_vendor_approval_email, one
+            dict per vendor
+
+    Returns:
+        int: Number of emails sent successfully
+    """
+    recipients = list(recipients)
+    sent = email_sender.send_emails(
+        (
+            recipient["email"],
+            APPROVAL_EMAIL_SUBJECT,
+            "vendor_approval_email.html",
+            _vendor_approval_context(**recipient),
+        )
+        for recipient in recipients
+    )
+
+    if sent < len(recipients):
+        logger.warning(
+            "Sent %d of %d vendor approval emails", sent, len(recipients)
+        )
+
+    return sent
+
+
 def send_vendor_rejection_email(
     email: EmailStr,
     vendor_name: str,
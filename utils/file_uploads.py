@@ -1,5 +1,6 @@
 import uuid
-from typing import Optional
+from functools import lru_cache
+from typing import Iterable, List, Optional
 from urllib.parse import urljoin
 
 from fastapi import HTTPException, UploadFile, status
@@ -8,7 +9,7 @@ from core.config import settings
 from core.logging_config import get_logger
 from utils.format_validators import is_valid_filename, sanitize_filename
 from utils.secure_filename import secure_filename
-from utils.upload_files import delete_file_from_s3, upload_file_to_s3
+from utils.upload_files import delete_file_from_s3, upload_fileobj_to_s3
 
 logger = get_logger(__name__)
 
@@ -36,8 +37,11 @@ async def save_uploaded_file(
             detail="Unsupported file type.",
         )
 
-    content = await file.read()
-    if len(content) > settings.MAX_UPLOAD_SIZE:
+    # Measure the spooled upload instead of reading it into memory
+    size = file.size
+    if size is None:
+        size = file.file.seek(0, 2)
+    if size > settings.MAX_UPLOAD_SIZE:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"File size exceeds the limit of {settings.MAX_UPLOAD_SIZE} bytes.",
@@ -51,8 +55,9 @@ async def save_uploaded_file(
     relative_path = f"{relative_sub_path}/{safe_filename}".strip("/")
 
     try:
-        await upload_file_to_s3(
-            file_content=content,
+        file.file.seek(0)
+        await upload_fileobj_to_s3(
+            file.file,
             file_path=relative_path,
             file_type=file.content_type,
         )
@@ -109,6 +114,12 @@ def get_media_url(relative_path: Optional[str]) -> Optional[str]:
     if not relative_path or not isinstance(relative_path, str):
         return None
 
+    return _media_url(relative_path)
+
+
+@lru_cache(maxsize=4096)
+def _media_url(relative_path: str) -> Optional[str]:
+    # Listings resolve the same image paths on every request
     if relative_path.startswith(("http://", "https://")):
         return relative_path
 
@@ -117,3 +128,21 @@ def get_media_url(relative_path: Optional[str]) -> Optional[str]:
         return None
 
     return urljoin(settings.spaces_public_url.rstrip("/") + "/", relative_path)
+
+
+def get_media_urls(relative_paths: Iterable[Optional[str]]) -> List[Optional[str]]:
+    """
+    Batch version of get_media_url for image lists.
+    The Spaces base URL is resolved once instead of per path.
+    """
+    base_url = settings.spaces_public_url.rstrip("/") + "/"
+    urls = []
+    for path in relative_paths:
+        if not path or not isinstance(path, str):
+            urls.append(None)
+        elif path.startswith(("http://", "https://")):
+            urls.append(path)
+        else:
+            path = path.strip().lstrip("/\\")
+            urls.append(base_url + path if path else None)
+    return urls
@@ -1,4 +1,5 @@
 import base64
+from functools import lru_cache
 import os
 import random
 import secrets
@@ -120,7 +121,9 @@ def generate_key():
     return base64.urlsafe_b64encode(os.urandom(32))
 
 
-# Use the string directly (assuming it's loaded into settings.FERNET_KEY)
+# Use the string directly (assuming it's loaded into settings.FERNET_KEY).
+# The key is a raw Fernet key, not a passphrase, so there is no derivation
+# step; the instance is built once at import and shared by every call.
 fernet = Fernet(settings.FERNET_KEY.encode())
 
 
@@ -132,6 +135,13 @@ def decrypt_data(token: str) -> str:
     return fernet.decrypt(token.encode()).decode()
 
 
+# A token always decrypts to the same value and a changed value gets a new
+# token, so results can be memoized on the token without invalidation.
+@lru_cache(maxsize=10_000)
+def decrypt_cached(token: str) -> str:
+    return decrypt_data(token)
+
+
 def hash_data(data: str) -> str:
     return hashlib.sha256(data.encode()).hexdigest()
 
@@ -1,8 +1,9 @@
 import mimetypes
-from typing import Optional, Tuple
+from typing import Any, Optional, Tuple
 
 import aioboto3
 import filetype
+from boto3.s3.transfer import TransferConfig
 from botocore.exceptions import ClientError
 from fastapi import HTTPException, UploadFile
 
@@ -11,6 +12,14 @@ from core.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Streamed uploads are sent in 8 MB multipart chunks so a file is never
+# held in memory in full.
+STREAM_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+    max_concurrency=8,
+)
+
 
 def get_file_mime_type(file: UploadFile) -> Tuple[str, bytes]:
     """
@@ -121,6 +130,82 @@ async def upload_file_to_s3(
             ) from e
 
 
+async def upload_fileobj_to_s3(
+    fileobj: Any,
+    file_path: str,
+    file_type: Optional[str] = None,
+) -> str:
+    """
+    Stream a file-like object to DigitalOcean Spaces (S3-compatible)
+    without reading it fully into memory.
+
+    Args:
+        fileobj (Any): A readable binary file object (sync or async,
+        e.g. an aiofiles handle or ``UploadFile.file``).
+        file_path (str): The path where the file will be stored in the bucket.
+        file_type (Optional[str]): MIME type of the file. If not provided,
+        it's guessed from the file extension.
+
+    Returns:
+        str: Public URL to access the uploaded file.
+
+    Raises:
+        HTTPException: Raised if the upload fails.
+    """
+    content_type = (
+        file_type
+        or mimetypes.guess_type(file_path)[0]
+        or "application/octet-stream"
+    )
+
+    session = aioboto3.Session()
+    async with session.client(
+        "s3",
+        region_name=settings.SPACES_REGION_NAME,
+        endpoint_url=settings.SPACES_ENDPOINT_URL,
+        aws_access_key_id=settings.SPACES_ACCESS_KEY_ID,
+        aws_secret_access_key=settings.SPACES_SECRET_ACCESS_KEY,
+    ) as s3_client:
+        try:
+            await s3_client.upload_fileobj(
+                fileobj,
+                settings.SPACES_BUCKET_NAME,
+                file_path,
+                ExtraArgs={"ContentType": content_type, "ACL": "public-read"},
+                Config=STREAM_TRANSFER_CONFIG,
+            )
+
+            file_url = f"{settings.spaces_public_url}/{file_path}"
+            logger.info(
+                "File streamed successfully",
+                extra={
+                    "file_url": file_url,
+                    "file_path": file_path,
+                    "content_type": content_type,
+                },
+            )
+            return file_url
+
+        except ClientError as e:
+            logger.error(
+                "S3 upload error",
+                exc_info=True,
+                extra={"error": str(e), "file_path": file_path},
+            )
+            raise HTTPException(
+                status_code=500, detail=f"Failed to upload file: {str(e)}"
+            ) from e
+        except Exception as e:
+            logger.error(
+                "Unexpected error during upload",
+                exc_info=True,
+                extra={"error": str(e), "file_path": file_path},
+            )
+            raise HTTPException(
+                status_code=500, detail="Unexpected error during file upload."
+            ) from e
+
+
 async def delete_file_from_s3(
     relative_path: str, delete_folder: bool = False
 ) -> bool: